@@ -5,7 +5,6 @@ This module handles the aliens class and all it's functions.
 7-26-25
 """
 
-import pygame
 from pygame.sprite import Sprite
 from typing import TYPE_CHECKING
 
@@ -18,24 +17,28 @@ class Alien (Sprite):
     Args:
         Sprite (pygame.sprite.Sprite): The image of the alien scaled.
     """
-    def __init__(self, fleet: 'AlienFleet', x: float, y: float):
+    def __init__(self, fleet: 'AlienFleet', x: float, y: float, index: int, col: int, row: int):
         """Initializes the alien and sets its starting position.
 
         Args:
             fleet (AlienFleet): The fleet object this alien belongs to.
             x (float): The initial x-coordinate of the alien.
             y (float): The initial y-coordinate of the alien.
+            index (int): The alien's place in the fleet, and its row in the NumPy backend.
+            col (int): The grid column of the alien.
+            row (int): The grid row of the alien.
         """
         super().__init__()
         self.fleet = fleet
-        self.screen = fleet.game.screen
-        self.boundaries = fleet.game.screen.get_rect()
         self.settings = fleet.game.settings
+        self.index = index
+        self.col = col
+        self.row = row
 
-        self.image = pygame.image.load(self.settings.alien_file)
-        self.image = pygame.transform.scale(self.image, 
-            (self.settings.alien_h, self.settings.alien_w)                            
+        self.image = fleet.game.assets.get_image(self.settings.alien_file,
+            (self.settings.alien_w, self.settings.alien_h)
             )
+        self.mask = fleet.mask
         
         self.rect  = self.image.get_rect()
         self.rect.x = x
@@ -44,6 +47,19 @@ class Alien (Sprite):
         self.x = float(self.rect.x)
 
 
+    def place(self, x: float, y: float):
+        """Moves the alien to a new position, such as its starting spot in a new fleet.
+
+        Args:
+            x (float): The new x-coordinate of the alien.
+            y (float): The new y-coordinate of the alien.
+        """
+        self.rect.x = x
+        self.rect.y = y
+        self.y = float(self.rect.y)
+        self.x = float(self.rect.x)
+
+
     def update(self):
         """Updates the alien's horizontal and vertical position.
         """
@@ -51,18 +67,3 @@ class Alien (Sprite):
         self.y += self.settings.fleet_speed * self.fleet.fleet_y_direction
         self.rect.x = self.x
         self.rect.y = self.y
-
-
-    def check_edges(self):
-        """Checks if the alien is at the top or bottom edge of the screen.
-
-        Returns:
-            bool: True if the alien is at an edge, False otherwise.
-        """
-        return (self.rect.bottom >= self.boundaries.bottom or self.rect.top <= self.boundaries.top)
-
-
-    def draw_alien(self):
-        """Draws the alien.
-        """
-        self.screen.blit(self.image, self.rect)
@@ -6,15 +6,37 @@ This module handles the alien fleet class and all it's functions.
 """
 
 import pygame
+from collections import OrderedDict
 from alien import Alien
-from typing import TYPE_CHECKING
+from fleet_arrays import FleetArrays
+from spatial_hash import SpatialHash
+from typing import NamedTuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from alien_invasion import AlienInvasion
 
+
+class FleetLayout(NamedTuple):
+    """Where every alien of a fleet starts, worked out once per screen size, alien size, and spacing.
+    """
+    fleet_w: int
+    fleet_h: int
+    x_offset: int
+    y_offset: int
+    cells: tuple
+    xs: tuple
+    ys: tuple
+
+
 class AlienFleet:
     """A class to manage the creation and behavior of the alien fleet.
+
+    Layouts are shared by every fleet in the process, and only the most
+    recently used layout_capacity of them are kept.
     """
+    layouts = OrderedDict()
+    layout_capacity = 4
+
     def __init__(self, game: 'AlienInvasion') -> None:
         """Inizializes the alien fleet.
 
@@ -23,45 +45,95 @@ class AlienFleet:
         """
         self.game = game
         self.settings = game.settings
+        self.boundaries = game.screen.get_rect()
         self.fleet = pygame.sprite.Group()
         self.fleet_x_direction = self.settings.fleet_x_direction
         self.fleet_y_direction = self.settings.fleet_y_direction
 
+        self.aliens = []
+        self.layout = None
+        self.mask = game.assets.get_mask(self.settings.alien_file,
+            (self.settings.alien_w, self.settings.alien_h))
+        self.grid = SpatialHash(self.settings.alien_w, self.settings.alien_h)
+        self.arrays = None
+        if self.settings.fleet_backend == 'numpy':
+            self.arrays = FleetArrays(self.settings.alien_w, self.settings.alien_h)
+
         self.create_fleet()
 
 
     def create_fleet(self):
-        """Creates a fleet of aliens at the right of the screen.
+        """Creates a fleet of aliens at the right of the screen. When the layout has not changed
+        the aliens from the last fleet are moved back into place instead of being created again.
+        """
+        layout = self._get_layout()
+        self.fleet.empty()
+        self.last_move = (0, 0)
+        self.grid.reset(layout.x_offset, layout.y_offset, layout.fleet_w, layout.fleet_h)
+        if layout is self.layout:
+            self._recycle_fleet(layout)
+        else:
+            self.aliens = []
+            self._create_rectangle_fleet(layout)
+            self.layout = layout
+        if self.arrays is not None:
+            self.arrays.reset(layout.xs, layout.ys)
+
+
+    def _get_layout(self):
+        """Returns the fleet layout for the current screen size, alien size, and spacing,
+        working it out the first time.
+
+        Returns:
+            FleetLayout: The shared layout.
         """
         alien_w = self.settings.alien_w
         alien_h = self.settings.alien_h
         screen_w = self.settings.screen_w
         screen_h = self.settings.screen_h
+        spacing = self.settings.fleet_spacing
+        key = (screen_w, screen_h, alien_w, alien_h, spacing)
+        layout = self.layouts.get(key)
+        if layout is not None:
+            self.layouts.move_to_end(key)
+            return layout
 
         fleet_w, fleet_h = self.calculate_fleet_size(alien_w, alien_h, screen_w, screen_h)
-
         x_offset, y_offset = self.calculate_offsets(alien_w, alien_h, screen_w, screen_h, fleet_w, fleet_h)
-        self._create_rectangle_fleet(alien_w, alien_h, fleet_w, fleet_h, x_offset, y_offset)
+        cells = tuple(
+            (alien_w * col + x_offset, alien_h * row + y_offset, col, row)
+            for row in range(spacing - 1, fleet_h, spacing)
+            for col in range(spacing - 1, fleet_w, spacing)
+            )
+        layout = FleetLayout(fleet_w, fleet_h, x_offset, y_offset, cells,
+            tuple(float(cell[0]) for cell in cells), tuple(float(cell[1]) for cell in cells))
+        self.layouts[key] = layout
+        if len(self.layouts) > self.layout_capacity:
+            self.layouts.popitem(last=False)
+        return layout
+
+
+    def _create_rectangle_fleet(self, layout):
+        """Creates an alien in the layout's grid, every other row and column by default.
+
+        Args:
+            layout (FleetLayout): The positions and grid cells of the aliens.
+        """
+        for current_x, current_y, col, row in layout.cells:
+            self._create_alien(current_x, current_y, col, row)
 
 
-    def _create_rectangle_fleet(self, alien_w, alien_h, fleet_w, fleet_h, x_offset, y_offset):
-        """Creates a grid for the aliens to be organized in based on dimensions and offsets.
+    def _recycle_fleet(self, layout):
+        """Moves the existing aliens back to their starting cells and returns them to the fleet.
 
         Args:
-            alien_w (int): Width of an alien.
-            alien_h (int): Height of an alien.
-            fleet_w (int): Number of columns in the fleet.
-            fleet_h (int): Numberv of rows in the fleet.
-            x_offset (float): The starting horizontal position of the fleet.
-            y_offset (float): The starting vertical position of the fleet.
+            layout (FleetLayout): The positions and grid cells of the aliens.
         """
-        for row in range(fleet_h):
-            for col in range(fleet_w):
-                current_x = alien_w * col + x_offset
-                current_y = alien_h * row + y_offset
-                if col % 2 == 0 or row % 2 == 0:
-                    continue
-                self._create_alien(current_x, current_y)
+        alien: Alien
+        for alien, (current_x, current_y, col, row) in zip(self.aliens, layout.cells):
+            alien.place(current_x, current_y)
+            self.grid.insert(alien, col, row)
+        self.fleet.add(self.aliens)
 
 
     def calculate_offsets(self, alien_w, alien_h, screen_w, screen_h, fleet_w, fleet_h):
@@ -117,32 +189,39 @@ class AlienFleet:
         return int(fleet_w), int(fleet_h)
 
 
-    def _create_alien(self, current_x: int, current_y: int):
-        """Creates a single alien and adds it to the fleet.
+    def _create_alien(self, current_x: int, current_y: int, col: int, row: int):
+        """Creates a single alien and adds it to the fleet and the grid.
 
         Args:
             current_x (int): The x coordinate of the alien.
             current_y (int): The y coordinate of the alien.
+            col (int): The grid column of the alien.
+            row (int): The grid row of the alien.
         """
-        new_alien = Alien(self, current_x, current_y)
+        new_alien = Alien(self, current_x, current_y, len(self.aliens), col, row)
+        self.aliens.append(new_alien)
+        self.grid.insert(new_alien, col, row)
         self.fleet.add(new_alien)
 
 
     def _check_fleet_edges(self):
         """Checks if the fleet has reached the top or bottom edge of the screen.
         """
-        alien: Alien
-        for alien in self.fleet:
-            if alien.check_edges():
-                self._change_fleet_direction()
-                break
+        if self.grid.count and (self.grid.bottom() >= self.boundaries.bottom
+                or self.grid.top() <= self.boundaries.top):
+            self._change_fleet_direction()
     
 
     def _change_fleet_direction(self):
         """Shifts the entire fleet left and changes its vertical direction."""
-        alien: 'Alien'
-        for alien in self.fleet.sprites():
-            alien.x -= self.settings.fleet_drop_speed
+        self.grid.move(-self.settings.fleet_drop_speed, 0)
+        self.last_move = (-self.settings.fleet_drop_speed, 0)
+        if self.arrays is not None:
+            self.arrays.move(-self.settings.fleet_drop_speed, 0)
+        else:
+            alien: 'Alien'
+            for alien in self.fleet.sprites():
+                alien.x -= self.settings.fleet_drop_speed
 
         self.fleet_y_direction *= -1
 
@@ -150,20 +229,50 @@ class AlienFleet:
     def update_fleet(self):
         """Updates the position of aliens in the fleet.
         """
+        self.last_move = (0, 0)
         self._check_fleet_edges()
-        self.fleet.update()
+        speed = self.settings.fleet_speed
+        dx = speed * self.fleet_x_direction
+        dy = speed * self.fleet_y_direction
+        self.last_move = (self.last_move[0] + dx, self.last_move[1] + dy)
+        self.grid.move(dx, dy)
+        if self.arrays is not None:
+            self.arrays.move(dx, dy)
+        else:
+            self.fleet.update()
+
 
+    def draw(self, alpha=1.0):
+        """Draws the aliens in the fleet on the screen with a single batched blit.
 
-    def draw(self):
-        """Draws the aliens in the fleet on the screen.
+        Args:
+            alpha (float, optional): Fraction of a tick to draw the fleet ahead of
+                its last position. Defaults to 1.0.
+
+        Returns:
+            list[pygame.Rect]: The areas drawn on.
         """
+        offset_x = round((alpha - 1) * self.last_move[0])
+        offset_y = round((alpha - 1) * self.last_move[1])
+        if self.arrays is not None:
+            image = self.game.assets.get_image(self.settings.alien_file,
+                (self.settings.alien_w, self.settings.alien_h))
+            return self.game.window.blits([(image, (x + offset_x, y + offset_y))
+                for x, y in self.arrays.positions()])
+
         alien:'Alien'
-        for alien in self.fleet:
-            alien.draw_alien()
+        if offset_x or offset_y:
+            return self.game.window.blits([(alien.image, alien.rect.move(offset_x, offset_y))
+                for alien in self.fleet])
+        return self.game.window.blits([(alien.image, alien.rect) for alien in self.fleet])
 
 
     def check_collisions(self, other_group):
-        """Checks for collisions between the fleet and other groups.
+        """Checks for collisions between the fleet and other groups, removing the sprites that hit.
+
+        Each sprite in the other group destroys at most one alien, the first one
+        in the fleet that it overlaps, the same as pygame.sprite.groupcollide.
+        Sprites are tested against their masks as well when pixel collisions are on.
 
         Args:
             other_group (pygame.sprite.Group): The group to check for collisions against.
@@ -171,8 +280,76 @@ class AlienFleet:
         Returns:
             dict: A dictonary of colliding sprites.
         """
-        return pygame.sprite.groupcollide(self.fleet, other_group, True, True)
-    
+        collisions = {}
+        bounds = self.grid.bounds()
+        for sprite in other_group:
+            if not bounds.colliderect(sprite.rect):
+                continue
+            hits = self.collide_rect(sprite.rect, sprite.mask)
+            if hits:
+                alien = min(hits, key=lambda hit: hit.index)
+                collisions.setdefault(alien, []).append(sprite)
+        collisions = dict(sorted(collisions.items(), key=lambda item: item[0].index))
+        for alien, sprites in collisions.items():
+            self._remove_alien(alien)
+            for sprite in sprites:
+                sprite.kill()
+        return collisions
+
+
+    def collide_rect(self, rect, mask=None):
+        """Finds the aliens that overlap a rectangle, using the grid to skip distant aliens.
+
+        When a mask is given and pixel collisions are on, aliens whose rectangles
+        overlap are only counted if their opaque pixels overlap too.
+
+        Args:
+            rect (pygame.Rect): The rectangle to test, such as the ship's.
+            mask (pygame.mask.Mask, optional): The opaque pixels inside the rectangle. Defaults to None.
+
+        Returns:
+            list[Alien]: The overlapping aliens.
+        """
+        candidates = self.grid.query(rect)
+        if not candidates:
+            return candidates
+        if self.arrays is not None:
+            for alien in candidates:
+                self._sync_alien(alien)
+        hits = [alien for alien in candidates if alien.rect.colliderect(rect)]
+        if not hits or mask is None or not self.settings.pixel_collisions:
+            return hits
+        return [alien for alien in hits
+            if self.mask.overlap(mask, (rect.x - alien.rect.x, rect.y - alien.rect.y))]
+
+
+    def _remove_alien(self, alien):
+        """Removes a destroyed alien from the fleet, the grid, and the arrays.
+
+        Args:
+            alien (Alien): The alien to remove.
+        """
+        self.grid.remove(alien.col, alien.row)
+        if self.arrays is not None:
+            self.arrays.kill(alien.index)
+        alien.kill()
+
+
+    def _sync_alien(self, alien):
+        """Copies an alien's position out of the fleet arrays onto its sprite.
+
+        Args:
+            alien (Alien): The alien to update.
+
+        Returns:
+            Alien: The updated alien.
+        """
+        alien.x = float(self.arrays.x[alien.index])
+        alien.y = float(self.arrays.y[alien.index])
+        alien.rect.x = alien.x
+        alien.rect.y = alien.y
+        return alien
+
 
     def check_fleet_left(self):
         """Checks if any aliens have reached the Left side of the screen.
@@ -180,11 +357,7 @@ class AlienFleet:
         Returns:
             bool: True if an alien reached the left edge, False otherwise.
         """
-        alien: Alien
-        for alien in self.fleet:
-            if alien.rect.left <= 0:
-                return True
-        return False
+        return bool(self.grid.count) and self.grid.left() <= 0
     
     
     def check_destroyed_status(self):
@@ -193,4 +366,4 @@ class AlienFleet:
         Returns:
             bool: True if the fleet is empty, False otherwise.
         """
-        return not self.fleet
\ No newline at end of file
+        return not self.grid.count
\ No newline at end of file
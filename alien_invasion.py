@@ -5,78 +5,252 @@ This program is a recreated version of space invaders with the orientation flipp
 7-20-25
 """
 
+import os
 import sys
+import argparse
+from pathlib import Path
 import pygame
 import random
+from datetime import datetime
 from settings import Settings
 from game_stats import Gamestats
 from ship import Ship
 from arsenal import Arsenal
 from alien_fleet import AlienFleet
-from time import sleep 
+from time import perf_counter
 from button import Button
 from hud import HUD
 from powerup import PowerUp
+from asset_cache import AssetCache
+from input_source import InputState, RandomInput
+from replay import InputRecorder, ReplayInput
+from renderer import DirtyRectRenderer
+from profiler import FrameProfiler
+from latency import LatencyTracker
+from particles import ParticleSystem
+from window import Window
+from sound_bank import SoundBank
 
 
 class AlienInvasion:
     """Game loop class that manages games assets, resources, and logic.
     """
-    def __init__(self):
+    EVENT_TYPES = (pygame.QUIT, pygame.KEYDOWN, pygame.KEYUP, pygame.MOUSEBUTTONDOWN, pygame.VIDEORESIZE)
+
+    def __init__(self, settings=None, headless=False, input_source=None):
         """Initializes the game and manages all of the game resources.
+
+        Args:
+            settings (Settings, optional): Settings to use instead of the defaults. Defaults to None.
+            headless (bool, optional): Runs without a real window or sound card. Defaults to False.
+            input_source (optional): Object with a poll(game) method returning an InputState
+                for each tick of a headless run. Defaults to None.
         """
+        self.start_time = perf_counter()
+        self.first_frame_ms = None
+        self.headless = headless
+        self.input_source = input_source
+        if headless:
+            os.environ['SDL_VIDEODRIVER'] = 'dummy'
+            os.environ['SDL_AUDIODRIVER'] = 'dummy'
+
         pygame.init()
-        self.settings = Settings()
+        self.settings = settings or Settings()
         self.settings.initialize_dynamic_settings()
         
-        self.screen = pygame.display.set_mode(
-            (self.settings.screen_w,self.settings.screen_h)
-            )
+        self.assets = AssetCache(self.settings.asset_cache_dir)
+        self.window = Window(self, self.settings.resizable and not headless)
+        self.screen = self.window.frame
         pygame.display.set_caption(self.settings.name)
-        
-        self.bg = pygame.image.load(self.settings.bg_file)
-        self.bg = pygame.transform.scale(self.bg, 
-            (self.settings.screen_w, self.settings.screen_h)
-            )
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(self.EVENT_TYPES)
         
         self.game_stats = Gamestats(self)
         self.HUD = HUD(self)
         self.running = True
         self.clock = pygame.time.Clock()
 
-        pygame.mixer.init()
-        self.laser_sound = pygame.mixer.Sound(self.settings.laser_sound)
-        self.laser_sound.set_volume(0.7)
-        self.impact_sound = pygame.mixer.Sound(self.settings.impact_sound)
-        self.impact_sound.set_volume(0.7)
+        self.sounds = SoundBank(self.settings.sound_enabled and not headless)
+        self.sounds.load('laser', self.settings.laser_sound, self.settings.laser_channels,
+            self.settings.sound_volume, 250)
+        self.sounds.load('impact', self.settings.impact_sound, self.settings.impact_channels,
+            self.settings.sound_volume, 500)
 
         self.ship = Ship(self, Arsenal(self))
         self.alien_fleet = AlienFleet(self)
-        self.alien_fleet.create_fleet()
         self.powerups = pygame.sprite.Group()
+        self.particles = ParticleSystem(self.settings, self.settings.particles_enabled and not headless,
+            self.settings.seed)
 
         self.play_button = Button(self, 'Play')
         self.game_active = False
+        self.respawn_ticks = 0
+        self.fire_requests = 0
+
+        self.seeds = random.Random(self.settings.seed)
+        self.game_seed = self.seeds.getrandbits(32)
+        self.rng = random.Random(self.game_seed)
+        self.recorder = None
+
+        self.profiler = FrameProfiler(self.settings.profile_enabled, self.settings.profile_frames)
+        self.latency = LatencyTracker(self.settings.latency_enabled, self.settings.latency_presses)
+        self.renderer = None
+        if self.settings.render_mode == 'dirty':
+            self.renderer = DirtyRectRenderer(self)
     
 
     def run_game(self):
         """Starts the main game loop.
+
+        The first frame is drawn straight away and the time it took from startup
+        is reported. The game logic advances in fixed ticks of 1 / FPS seconds no
+        matter how fast frames are drawn. Time left over between ticks is used to
+        draw the moving sprites part of the way to their next position. In low
+        latency mode events are read right before each tick instead of once at
+        the start of the frame.
         """
+        self._update_screen()
+        self.first_frame_ms = (perf_counter() - self.start_time) * 1000
+        print(f'First frame in {self.first_frame_ms:.0f} ms')
+
+        tick_time = 1 / self.settings.FPS
+        accumulator = 0.0
+        previous = perf_counter()
         while self.running:
-            self._check_events()
-            if self.game_active:
-                self.ship.update()
-                self.powerups.update()
-                self.alien_fleet.update_fleet()
-                self._check_collisions()
-            self._update_screen()
-            self.clock.tick(self.settings.FPS)
+            now = perf_counter()
+            accumulator += now - previous
+            previous = now
+
+            self.profiler.begin_frame()
+            low_latency = self.settings.low_latency
+            if not low_latency:
+                self._check_events()
+                self.profiler.mark('events')
+            ticks = 0
+            while accumulator >= tick_time and ticks < self.settings.max_ticks_per_frame:
+                if low_latency:
+                    self._check_events()
+                    self.profiler.mark('events')
+                if self.game_active:
+                    self.step(self._take_keyboard_input())
+                accumulator -= tick_time
+                ticks += 1
+            if ticks == self.settings.max_ticks_per_frame:
+                accumulator = min(accumulator, tick_time)
+            if low_latency and not ticks:
+                self._check_events()
+                self.profiler.mark('events')
+
+            self._update_screen(self._interpolation(accumulator / tick_time))
+            self.latency.presented()
+            self.profiler.mark('screen')
+            self.particles.check_budget(perf_counter() - now)
+            self.profiler.end_frame()
+            self.clock.tick(self.settings.render_fps)
+
+
+    def run_headless(self, max_ticks, seed=None):
+        """Plays one game without drawing or waiting between ticks, using the input source.
+
+        Args:
+            max_ticks (int): The most ticks to simulate before stopping.
+            seed (int, optional): Seed for the game's random numbers. Defaults to None,
+                which takes the next seed from Settings.seed.
+
+        Returns:
+            int: How many ticks were simulated.
+        """
+        self.restart_game(seed)
+        ticks = 0
+        while self.game_active and ticks < max_ticks:
+            self.profiler.begin_frame()
+            self.step(self.input_source.poll(self))
+            self.profiler.end_frame()
+            ticks += 1
+        return ticks
+
+
+    def step(self, input_state):
+        """Applies one tick of input and advances the game logic by one tick.
+
+        Args:
+            input_state (InputState): The input for this tick.
+        """
+        if self.recorder is not None:
+            self.recorder.record(input_state)
+        self.sounds.next_tick()
+        self._apply_input(input_state)
+        if self.game_active:
+            self._update_game()
+
+
+    def _update_game(self):
+        """Advances the ship, power-ups, and fleet by one tick and checks for collisions.
+        Only the explosions move while the player is waiting to respawn.
+        """
+        self.game_stats.ticks += 1
+        self.particles.update()
+        self.profiler.mark('particles')
+        if self.respawn_ticks > 0:
+            self.respawn_ticks -= 1
+            return
+        self.ship.update()
+        self.profiler.mark('ship')
+        self.powerups.update()
+        self.profiler.mark('powerups')
+        self.alien_fleet.update_fleet()
+        self.profiler.mark('fleet')
+        self._check_collisions()
+        self.profiler.mark('collisions')
+
+
+    def _interpolation(self, alpha):
+        """Decides how far between ticks to draw the moving sprites.
+
+        Args:
+            alpha (float): Fraction of a tick that has passed since the last update.
+
+        Returns:
+            float: The fraction to draw at, 1.0 when nothing is moving.
+        """
+        if not self.game_active or self.respawn_ticks > 0:
+            return 1.0
+        return alpha
+
+
+    def _apply_input(self, input_state):
+        """Sets the ship's movement and fires from a programmatic input state.
+
+        Args:
+            input_state (InputState): The input for this tick.
+        """
+        self.ship.moving_up = input_state.moving_up
+        self.ship.moving_down = input_state.moving_down
+        if input_state.fire and self.game_active and not self.respawn_ticks:
+            self._fire_bullet()
+
+
+    def _take_keyboard_input(self):
+        """Turns the keys held and pressed since the last tick into this tick's input.
+        Each press of the space key fires on its own tick.
+
+        Returns:
+            InputState: The input for this tick.
+        """
+        fire = self.fire_requests > 0
+        if fire:
+            self.fire_requests -= 1
+            self.latency.apply('fire')
+        self.latency.apply('move')
+        return InputState(self.ship.moving_up, self.ship.moving_down, fire)
 
 
     def _check_collisions(self):
         """Checks for collisions with aliens or powerups, plays a sound, and resets the level if the fleet is destroyed.
         """
-        if self.ship.check_collisions(self.alien_fleet.fleet):
+        ship_center = self.ship.rect.center
+        if self.ship.check_collisions(self.alien_fleet):
+            self.particles.explode(ship_center)
             self._check_game_status()
         
         if self.alien_fleet.check_fleet_left():
@@ -86,12 +260,13 @@ class AlienInvasion:
 
         collisions = self.alien_fleet.check_collisions(self.ship.arsenal.arsenal)
         if collisions:
+            for alien in collisions:
+                self.particles.explode(alien.rect.center)
             for aliens in collisions.values():
                 for alien in aliens:
-                    if random.random() < 0.2:
+                    if self.rng.random() < self.settings.powerup_chance:
                         self._create_powerup(alien.rect.center)
-            self.impact_sound.play()
-            self.impact_sound.fadeout(500)
+            self.sounds.play('impact')
             self.game_stats.update(collisions)
             self.HUD.update_scores()
 
@@ -110,23 +285,28 @@ class AlienInvasion:
 
 
     def _check_powerup_collisions(self):
-        """Check for collisions between the ship and power-ups.
+        """Check for collisions between the ship and power-ups. Power-ups that overlap
+        the ship's rectangle are checked pixel by pixel when pixel collisions are on.
         """
-        collided_powerup = pygame.sprite.spritecollideany(self.ship, self.powerups)
-        if collided_powerup:
-            self.ship.activate_powerup()
-            collided_powerup.kill()
+        for powerup in pygame.sprite.spritecollide(self.ship, self.powerups, False):
+            if not self.settings.pixel_collisions or pygame.sprite.collide_mask(self.ship, powerup):
+                self.ship.activate_powerup()
+                powerup.kill()
+                return
 
 
     def _check_game_status(self):
         """Resets the game if a ship is lost and ends the game on a game over.
         """
+        self.game_stats.ships_lost += 1
         if self.game_stats.ships_left > 0:
             self.game_stats.ships_left -= 1
             self._reset_level()
-            sleep(0.5)
+            self.respawn_ticks = int(self.settings.respawn_time * self.settings.FPS)
         else:
             self.game_active = False
+            self.game_stats.record_game()
+            self._save_recording()
 
 
     def _reset_level(self):
@@ -138,32 +318,113 @@ class AlienInvasion:
         self.powerups.empty()
 
 
-    def restart_game(self):
+    def restart_game(self, seed=None):
         """Resets the game stats, mouse vision, and recenters the ship.
+
+        Args:
+            seed (int, optional): Seed for the game's random numbers. Defaults to None,
+                which takes the next seed from Settings.seed.
         """
+        self.game_seed = seed if seed is not None else self.seeds.getrandbits(32)
+        self.rng = random.Random(self.game_seed)
         self.settings.initialize_dynamic_settings()
         self.game_stats.reset_stats()
         self.HUD.update_scores()
+        self.alien_fleet.fleet_y_direction = self.settings.fleet_y_direction
         self._reset_level()
         self.ship._center_ship()
+        self.respawn_ticks = 0
+        self.fire_requests = 0
+        self.latency.discard_waiting()
+        self.particles.clear()
         self.game_active = True
         pygame.mouse.set_visible(False)
 
+        if self.settings.record_replays:
+            self.recorder = InputRecorder(self.game_seed, self.settings.screen_w,
+                self.settings.screen_h)
 
-    def _update_screen(self):
-        """Updates the surfaces displayed.
+
+    def _save_recording(self):
+        """Saves the input recording of the current game, if one is being made.
         """
-        self.screen.blit(self.bg, (0,0))
-        self.ship.draw()
-        self.alien_fleet.draw()
-        self.powerups.draw(self.screen)
-        self.HUD.draw()
+        if self.recorder is None:
+            return
+        name = f'{datetime.now():%Y%m%d-%H%M%S}-{self.game_seed}.airp'
+        self.recorder.save(self.settings.replay_dir / name, self.game_stats.score)
+        self.recorder = None
+
+
+    def _update_screen(self, alpha=1.0):
+        """Updates the surfaces displayed.
 
+        Args:
+            alpha (float, optional): Fraction of a tick to draw moving sprites ahead of
+                their last position. Defaults to 1.0.
+        """
         if not self.game_active:
-            self.play_button.draw()
             pygame.mouse.set_visible(True)
 
-        pygame.display.flip()
+        if self.renderer is not None:
+            self.renderer.render(alpha)
+            return
+
+        self._draw_frame(alpha)
+        self.window.present()
+
+
+    def _draw_frame(self, alpha=1.0):
+        """Draws the background and every sprite onto the frame without showing it.
+
+        Args:
+            alpha (float, optional): Fraction of a tick to draw moving sprites ahead of
+                their last position. Defaults to 1.0.
+        """
+        self.window.canvas.blit(self.window.background, (0,0))
+        self._draw_sprites(alpha)
+
+
+    def _draw_sprites(self, alpha=1.0):
+        """Draws the ship, aliens, power-ups, HUD, and the Play button when the game is paused.
+
+        Args:
+            alpha (float, optional): Fraction of a tick to draw moving sprites ahead of
+                their last position. Defaults to 1.0.
+
+        Returns:
+            list[pygame.Rect]: The areas drawn on.
+        """
+        rects = self.ship.draw(alpha)
+        rects += self.alien_fleet.draw(alpha)
+        rects += self._draw_powerups(alpha)
+        rects += self.particles.draw(self.window.canvas, alpha, self.window.scale)
+        rects += self.HUD.draw()
+
+        if self.profiler.enabled and self.settings.profile_overlay:
+            rects.append(self.profiler.draw(self.window.canvas, self.window.to_canvas(
+                (self.HUD.padding, self.HUD.level_rect.bottom + self.HUD.padding)),
+                1 / self.settings.FPS))
+
+        if not self.game_active:
+            rects += self.play_button.draw()
+        return rects
+
+
+    def _draw_powerups(self, alpha=1.0):
+        """Draws the power-ups with a single batched blit.
+
+        Args:
+            alpha (float, optional): Fraction of a tick to draw the power-ups ahead of
+                their last position. Defaults to 1.0.
+
+        Returns:
+            list[pygame.Rect]: The areas drawn on.
+        """
+        offset_x = round((1 - alpha) * self.settings.powerup_speed)
+        if offset_x:
+            return self.window.blits([(powerup.image, powerup.rect.move(offset_x, 0))
+                for powerup in self.powerups])
+        return self.window.blits([(powerup.image, powerup.rect) for powerup in self.powerups])
 
 
     def _check_events(self):
@@ -171,22 +432,32 @@ class AlienInvasion:
         """
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
-                self.running = False
-                self.game_stats.save_scores()
-                pygame.quit()
-                sys.exit()
+                self._quit_game()
             elif event.type == pygame.KEYDOWN and self.game_active == True:
                 self._check_keydown_events(event)
             elif event.type == pygame.KEYUP:
                 self._check_keyup_events(event)
             elif event.type == pygame.MOUSEBUTTONDOWN:
                 self._check_button_clicked()
+            elif event.type == pygame.VIDEORESIZE:
+                self._resize_window(event.size)
+
+
+    def _resize_window(self, size):
+        """Fits the frame to the window's new size and redraws all of it.
+
+        Args:
+            size (tuple): The window's new (width, height).
+        """
+        self.window.resize(size)
+        if self.renderer is not None:
+            self.renderer.invalidate()
 
 
     def _check_button_clicked(self):
         """Confirms if the "Play" button is clicked.
         """
-        mouse_pos = pygame.mouse.get_pos()
+        mouse_pos = self.window.to_frame(pygame.mouse.get_pos())
         if self.play_button.check_clicked(mouse_pos):
             self.restart_game()
 
@@ -212,19 +483,109 @@ class AlienInvasion:
         """
         if event.key == pygame.K_UP:
             self.ship.moving_up = True
+            self.latency.received('move')
         elif event.key == pygame.K_DOWN:
             self.ship.moving_down = True
+            self.latency.received('move')
         elif event.key == pygame.K_SPACE:
-            if self.ship.fire():
-                self.laser_sound.play()
-                self.laser_sound.fadeout(250)
+            self.fire_requests += 1
+            self.latency.received('fire')
         elif event.key == pygame.K_q:
-            self.running = False
-            self.game_stats.save_scores()
-            pygame.quit()
-            sys.exit()
+            self._quit_game()
+
+
+    def _quit_game(self):
+        """Saves the scores and the frame profile, reports the input latency, then closes the game.
+        """
+        self.running = False
+        self._save_recording()
+        self.game_stats.save_scores()
+        self.profiler.dump(self.settings.profile_file)
+        self.latency.report()
+        pygame.quit()
+        sys.exit()
+
+
+    def _fire_bullet(self):
+        """Fires a bullet from the ship and plays the laser sound.
+        """
+        if self.ship.fire():
+            self.sounds.play('laser')
+
+
+def _parse_args():
+    """Reads the command line options.
+
+    Returns:
+        argparse.Namespace: The parsed options.
+    """
+    parser = argparse.ArgumentParser(description='Play Alien Invasion.')
+    parser.add_argument('--dirty-rects', action='store_true',
+        help='redraw only the changed parts of the screen each frame')
+    parser.add_argument('--profile', action='store_true',
+        help='time each phase of the frame, graph it on screen, and save it on exit')
+    parser.add_argument('--latency', action='store_true',
+        help='time key presses through the update and the flip and report percentiles on exit')
+    parser.add_argument('--low-latency', action='store_true',
+        help='read input right before each update instead of once per frame')
+    parser.add_argument('--record', action='store_true',
+        help='save the input of each game so it can be replayed')
+    parser.add_argument('--replay', type=Path,
+        help='replay a recorded game headlessly at full speed and check its final score')
+    parser.add_argument('--headless', action='store_true',
+        help='simulate games with random input as fast as possible and report ticks per second')
+    parser.add_argument('--ticks', type=int, default=10000,
+        help='ticks to simulate in headless mode')
+    parser.add_argument('--seed', type=int, default=None,
+        help='seed for the headless random input')
+    return parser.parse_args()
+
+
+def replay_game(path):
+    """Replays a recorded game headlessly and checks it ends with the recorded score.
+
+    Args:
+        path (Path): The recording to replay.
+
+    Returns:
+        bool: True if the replay matched the recording, False otherwise.
+    """
+    replay = ReplayInput(path)
+    settings = Settings()
+    settings.persist_scores = False
+    settings.screen_w = replay.screen_w
+    settings.screen_h = replay.screen_h
+    game = AlienInvasion(settings, headless=True, input_source=replay)
+    start = perf_counter()
+    ticks = game.run_headless(replay.ticks, replay.seed)
+    elapsed = perf_counter() - start
+    matched = ticks == replay.ticks and game.game_stats.score == replay.final_score
+    print(f'replayed {ticks} ticks in {elapsed:.2f}s, score {game.game_stats.score:,} '
+        f'(recorded {replay.final_score:,}): {"match" if matched else "MISMATCH"}')
+    return matched
 
 
 if __name__ == '__main__':
-    ai = AlienInvasion()
-    ai.run_game()
+    args = _parse_args()
+    if args.replay:
+        sys.exit(0 if replay_game(args.replay) else 1)
+    elif args.headless:
+        settings = Settings()
+        settings.persist_scores = False
+        ai = AlienInvasion(settings, headless=True, input_source=RandomInput(args.seed))
+        ticks = 0
+        start = perf_counter()
+        while ticks < args.ticks:
+            ticks += ai.run_headless(args.ticks - ticks)
+        elapsed = perf_counter() - start
+        print(f'{ticks} ticks in {elapsed:.2f}s ({ticks / elapsed:,.0f} ticks/s)')
+    else:
+        settings = Settings()
+        if args.dirty_rects:
+            settings.render_mode = 'dirty'
+        settings.profile_enabled = args.profile
+        settings.record_replays = args.record
+        settings.latency_enabled = args.latency
+        settings.low_latency = args.low_latency
+        ai = AlienInvasion(settings)
+        ai.run_game()
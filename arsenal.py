@@ -14,6 +14,10 @@ if TYPE_CHECKING:
 
 class Arsenal:
     """Manages the ships arsewnal of bullets.
+
+    Bullets come from a fixed pool sized for the powered-up bullet limit. A
+    bullet that is removed from the arsenal stays in the pool and is fired
+    again later instead of being created from scratch.
     """
     def __init__(self, game: 'AlienInvasion') -> None:
         """Initializes the ships loadout.
@@ -23,29 +27,39 @@ class Arsenal:
         """
         self.game = game
         self.settings = game.settings
+        self.boundaries = game.screen.get_rect()
         self.arsenal = pygame.sprite.Group()
 
+        capacity = max(self.settings.bullet_amount, self.settings.powerup_bullet_amount)
+        self.pool = [Bullet(game) for _ in range(capacity)]
+
 
     def update_arsenal(self):
         """Updates the bullets positions and removes them if the cross the right boundary.
         """
-        self.arsenal.update()
-        self._remove_bullets_offscreen()
+        right = self.boundaries.right
+        for bullet in self.pool:
+            if bullet.alive():
+                bullet.update()
+                if bullet.rect.left >= right:
+                    bullet.kill()
 
 
-    def _remove_bullets_offscreen(self):
-        """Establishes the boundary for the bullets and removes them.
-        """
-        for bullet in self.arsenal.copy():
-            if bullet.rect.left >= self.game.screen.get_rect().right:
-                self.arsenal.remove(bullet)
+    def draw(self, alpha=1.0):
+        """Draw the bullets on the screen with a single batched blit.
 
+        Args:
+            alpha (float, optional): Fraction of a tick to draw the bullets ahead of
+                their last position. Defaults to 1.0.
 
-    def draw(self):
-        """Draw the bullets on the screen.
+        Returns:
+            list[pygame.Rect]: The areas drawn on.
         """
-        for bullet in self.arsenal:
-            bullet.draw_bullet()
+        offset_x = round((alpha - 1) * self.settings.bullet_speed)
+        if offset_x:
+            return self.game.window.blits([(bullet.image, bullet.rect.move(offset_x, 0))
+                for bullet in self.arsenal])
+        return self.game.window.blits([(bullet.image, bullet.rect) for bullet in self.arsenal])
 
 
     def fire_bullet(self):
@@ -55,7 +69,22 @@ class Arsenal:
             bool: True if a bullet is fired, False if not.
         """
         if len(self.arsenal) < self.settings.bullet_amount:
-            new_bullet = Bullet(self.game)
-            self.arsenal.add(new_bullet)
+            bullet = self._get_free_bullet()
+            bullet.fire(self.game.ship.rect.midright)
+            self.arsenal.add(bullet)
             return True
-        return False
\ No newline at end of file
+        return False
+
+
+    def _get_free_bullet(self):
+        """Finds a pooled bullet that is not in flight, growing the pool only if the limit was raised.
+
+        Returns:
+            Bullet: A bullet ready to fire.
+        """
+        for bullet in self.pool:
+            if not bullet.alive():
+                return bullet
+        bullet = Bullet(self.game)
+        self.pool.append(bullet)
+        return bullet
\ No newline at end of file
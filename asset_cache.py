@@ -0,0 +1,195 @@
+"""
+Alien Invasion
+John Mead
+This module handles the asset cache class and all it's functions.
+10-18-26
+"""
+
+import os
+import struct
+import hashlib
+import pygame
+
+PIXEL_HEADER = struct.Struct('<II')
+
+
+class AssetCache:
+    """A class to load, scale, and convert each image once and share it between sprites.
+
+    When it is given a cache folder, the scaled and rotated pixels of each image
+    are also saved there as raw bytes, named by a hash of the source file and
+    the size and rotation they were made for. Later runs read those bytes back
+    instead of decoding and scaling the image again, and a changed source file
+    gets a new hash, so old pixels are never used.
+    """
+    def __init__(self, cache_dir=None) -> None:
+        """Initializes the empty image cache.
+
+        Args:
+            cache_dir (Path, optional): Folder to save scaled pixels in. Defaults to None,
+                which keeps them in memory only.
+        """
+        self._images = {}
+        self._masks = {}
+        self._hashes = {}
+        self.cache_dir = cache_dir
+
+
+    def get_image(self, path, size=None, rotation=0, alpha=True):
+        """Returns the shared surface for an image, loading it the first time it is asked for.
+
+        Args:
+            path (Path): The image file to load.
+            size (tuple, optional): The (width, height) to scale the image to. Defaults to None.
+            rotation (int, optional): Degrees to rotate the image after scaling. Defaults to 0.
+            alpha (bool, optional): Keeps per-pixel transparency when True. Defaults to True.
+
+        Returns:
+            pygame.Surface: The converted surface. It is shared, so it must not be drawn on.
+        """
+        key = (str(path), size, rotation, alpha)
+        image = self._images.get(key)
+        if image is None:
+            image = self._load_image(path, size, rotation, alpha)
+            self._images[key] = image
+        return image
+
+
+    def get_mask(self, path, size=None, rotation=0):
+        """Returns the shared collision mask of an image's opaque pixels, building it the
+        first time it is asked for.
+
+        Args:
+            path (Path): The image file.
+            size (tuple, optional): The (width, height) the image is scaled to. Defaults to None.
+            rotation (int, optional): Degrees the image is rotated. Defaults to 0.
+
+        Returns:
+            pygame.mask.Mask: The mask. It is shared, so it must not be changed.
+        """
+        key = (str(path), size, rotation)
+        mask = self._masks.get(key)
+        if mask is None:
+            mask = pygame.mask.from_surface(self.get_image(path, size, rotation))
+            self._masks[key] = mask
+        return mask
+
+
+    def _load_image(self, path, size, rotation, alpha):
+        """Decodes, scales, rotates, and converts an image to the display format.
+
+        Args:
+            path (Path): The image file to load.
+            size (tuple): The (width, height) to scale the image to, or None.
+            rotation (int): Degrees to rotate the image after scaling.
+            alpha (bool): Keeps per-pixel transparency when True.
+
+        Returns:
+            pygame.Surface: The converted surface.
+        """
+        pixel_format = 'RGBA' if alpha else 'RGB'
+        cache_path = self._cache_path(path, size, rotation, pixel_format)
+        image = self._read_pixels(cache_path, pixel_format)
+        if image is None:
+            image = pygame.image.load(path)
+            if size is not None:
+                image = pygame.transform.scale(image, size)
+            if rotation:
+                image = pygame.transform.rotate(image, rotation)
+            self._write_pixels(cache_path, image, pixel_format)
+        return image.convert_alpha() if alpha else image.convert()
+
+
+    def _cache_path(self, path, size, rotation, pixel_format):
+        """Works out the file the scaled pixels of an image are saved in.
+
+        Args:
+            path (Path): The image file.
+            size (tuple): The (width, height) the image is scaled to, or None.
+            rotation (int): Degrees the image is rotated.
+            pixel_format (str): 'RGBA' or 'RGB'.
+
+        Returns:
+            Path: The pixel file, or None if there is no cache folder.
+        """
+        if self.cache_dir is None:
+            return None
+        entry = self._hashes.get(str(path))
+        if entry is None:
+            stat = path.stat()
+            entry = (stat.st_mtime_ns, stat.st_size, hashlib.sha1(path.read_bytes()).hexdigest())
+            self._hashes[str(path)] = entry
+        digest = entry[2]
+        w, h = size if size is not None else (0, 0)
+        return self.cache_dir / f'{digest}_{w}x{h}_{rotation}_{pixel_format}.raw'
+
+
+    def _read_pixels(self, cache_path, pixel_format):
+        """Reads saved pixels back into a surface.
+
+        Args:
+            cache_path (Path): The pixel file, or None.
+            pixel_format (str): 'RGBA' or 'RGB'.
+
+        Returns:
+            pygame.Surface: The surface, or None if the pixels are not saved or are damaged.
+        """
+        if cache_path is None:
+            return None
+        try:
+            data = cache_path.read_bytes()
+            w, h = PIXEL_HEADER.unpack_from(data)
+            return pygame.image.frombytes(data[PIXEL_HEADER.size:], (w, h), pixel_format)
+        except (OSError, struct.error, ValueError):
+            return None
+
+
+    def _write_pixels(self, cache_path, image, pixel_format):
+        """Saves a surface's pixels, writing a temporary file first so a half written
+        file is never read. The temporary file is named after the process, so workers
+        filling a cold cache at the same time never write into each other's files.
+
+        Args:
+            cache_path (Path): The pixel file, or None.
+            image (pygame.Surface): The scaled and rotated surface.
+            pixel_format (str): 'RGBA' or 'RGB'.
+        """
+        if cache_path is None:
+            return
+        temp_path = cache_path.with_name(f'{cache_path.name}.{os.getpid()}.tmp')
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path.write_bytes(PIXEL_HEADER.pack(*image.get_size())
+                + pygame.image.tobytes(image, pixel_format))
+            os.replace(temp_path, cache_path)
+        except OSError as e:
+            print(f"Pixel Cache Not Saved: {e}")
+
+
+    def evict(self, path=None):
+        """Removes cached surfaces so they are rebuilt the next time they are asked for. The
+        source file is only hashed again if its modified time or size changed, so a file
+        that was replaced on disk is loaded fresh without re-reading one that was not.
+
+        Args:
+            path (Path, optional): Only evict surfaces made from this file. Defaults to None,
+                which evicts everything, such as after the asset set changes.
+        """
+        if path is None:
+            self._images.clear()
+            self._masks.clear()
+            self._hashes.clear()
+            return
+        for key in [key for key in self._images if key[0] == str(path)]:
+            del self._images[key]
+        for key in [key for key in self._masks if key[0] == str(path)]:
+            del self._masks[key]
+        entry = self._hashes.get(str(path))
+        if entry is not None:
+            try:
+                stat = path.stat()
+                changed = entry[:2] != (stat.st_mtime_ns, stat.st_size)
+            except OSError:
+                changed = True
+            if changed:
+                del self._hashes[str(path)]
@@ -0,0 +1,197 @@
+"""
+Alien Invasion
+John Mead
+This program plays many headless games across a process pool and summarizes their stats.
+10-18-26
+"""
+
+import os
+import argparse
+import statistics
+from multiprocessing import Pool
+from time import perf_counter
+from settings import Settings
+from input_source import InputState, RandomInput, ScriptedInput
+from alien_invasion import AlienInvasion
+
+
+def sweep_policy(seed):
+    """Makes a scripted policy that sweeps up and down the screen while firing steadily.
+
+    Args:
+        seed (int): Unused, the sweep is the same every game.
+
+    Returns:
+        ScriptedInput: The policy.
+    """
+    return ScriptedInput([InputState(tick < 60, tick >= 60, tick % 8 == 0) for tick in range(120)])
+
+
+def random_policy(seed):
+    """Makes a policy that moves at random and fires one tick in five.
+
+    Args:
+        seed (int): Seed for the policy's choices.
+
+    Returns:
+        RandomInput: The policy.
+    """
+    return RandomInput(seed)
+
+
+class TunedSettings(Settings):
+    """Settings with tuning values that are put back every time a game restarts.
+    """
+    def __init__(self, overrides):
+        """Initializes the settings with the tuning values.
+
+        Args:
+            overrides (dict): Settings attributes to change from the defaults.
+        """
+        self.overrides = dict(overrides)
+        super().__init__()
+        self.persist_scores = False
+        self._apply_overrides()
+
+
+    def initialize_dynamic_settings(self):
+        """Resets the dynamic settings, then puts the tuning values back.
+        """
+        super().initialize_dynamic_settings()
+        self._apply_overrides()
+
+
+    def _apply_overrides(self):
+        """Sets each tuning value on the settings.
+        """
+        for name, value in self.overrides.items():
+            setattr(self, name, value)
+
+
+POLICIES = {
+    'random': random_policy,
+    'sweep': sweep_policy,
+}
+
+_game = None
+
+
+def _start_worker(overrides):
+    """Creates the headless game each worker process reuses for all of its games.
+
+    Args:
+        overrides (dict): Settings attributes to change from the defaults.
+    """
+    global _game
+    _game = AlienInvasion(TunedSettings(overrides), headless=True)
+
+
+def play_game(job):
+    """Plays one game in a worker process.
+
+    Args:
+        job (tuple): The policy name, the game's seed, and the most ticks to play.
+
+    Returns:
+        dict: The policy, seed, score, level reached, ships lost, and ticks survived.
+    """
+    policy, seed, max_ticks = job
+    _game.input_source = POLICIES[policy](seed)
+    _game.run_headless(max_ticks, seed)
+    stats = _game.game_stats
+    return {
+        'policy': policy,
+        'seed': seed,
+        'score': stats.score,
+        'level': stats.level,
+        'ships_lost': stats.ships_lost,
+        'ticks': stats.ticks,
+    }
+
+
+def run_batch(policies, games, max_ticks, workers, overrides, seed=0):
+    """Plays games for each policy across a pool of worker processes.
+
+    Args:
+        policies (list[str]): Names from POLICIES to play.
+        games (int): Games to play per policy.
+        max_ticks (int): The most ticks a game may last.
+        workers (int): Number of worker processes.
+        overrides (dict): Settings attributes to change from the defaults.
+        seed (int, optional): Seed of the first game. Defaults to 0.
+
+    Returns:
+        list[dict]: The results of every game.
+    """
+    jobs = [(policy, seed + number, max_ticks) for policy in policies for number in range(games)]
+    chunksize = max(1, len(jobs) // (workers * 8))
+    with Pool(workers, initializer=_start_worker, initargs=(overrides,)) as pool:
+        results = list(pool.imap_unordered(play_game, jobs, chunksize))
+        # pygame catches SIGTERM in the workers, so they have to be shut down
+        # normally before the pool tries to terminate them.
+        pool.close()
+        pool.join()
+    return results
+
+
+def print_summary(results):
+    """Prints one row of averages per policy.
+
+    Args:
+        results (list[dict]): The results of every game.
+    """
+    columns = ('games', 'mean score', 'median', 'max score', 'mean level', 'ships lost', 'ticks')
+    print(f'{"policy":<10}' + ''.join(f'{column:>12}' for column in columns))
+    for policy in sorted({result['policy'] for result in results}):
+        games = [result for result in results if result['policy'] == policy]
+        scores = [game['score'] for game in games]
+        row = (
+            len(games),
+            statistics.mean(scores),
+            statistics.median(scores),
+            max(scores),
+            statistics.mean(game['level'] for game in games),
+            statistics.mean(game['ships_lost'] for game in games),
+            statistics.mean(game['ticks'] for game in games),
+        )
+        print(f'{policy:<10}' + ''.join(f'{value:>12,.1f}' for value in row))
+
+
+def _parse_args():
+    """Reads the command line options.
+
+    Returns:
+        argparse.Namespace: The parsed options.
+    """
+    defaults = Settings()
+    defaults.initialize_dynamic_settings()
+    parser = argparse.ArgumentParser(description='Play many headless Alien Invasion games in parallel.')
+    parser.add_argument('--games', type=int, default=100, help='games per policy')
+    parser.add_argument('--policy', nargs='+', choices=sorted(POLICIES), default=sorted(POLICIES),
+        help='policies to play')
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help='worker processes')
+    parser.add_argument('--max-ticks', type=int, default=36000, help='longest a game may last')
+    parser.add_argument('--seed', type=int, default=0, help='seed of the first game')
+    parser.add_argument('--difficulty-scale', type=float, default=defaults.difficulty_scale,
+        help='speed multiplier per level')
+    parser.add_argument('--alien-points', type=int, default=defaults.alien_points,
+        help='points per alien')
+    parser.add_argument('--powerup-chance', type=float, default=defaults.powerup_chance,
+        help='chance a destroyed alien drops a power-up')
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = _parse_args()
+    overrides = {
+        'difficulty_scale': args.difficulty_scale,
+        'alien_points': args.alien_points,
+        'powerup_chance': args.powerup_chance,
+    }
+    start = perf_counter()
+    results = run_batch(args.policy, args.games, args.max_ticks, args.workers, overrides, args.seed)
+    elapsed = perf_counter() - start
+    print_summary(results)
+    ticks = sum(result['ticks'] for result in results)
+    print(f'{len(results)} games, {ticks:,} ticks in {elapsed:.1f}s on {args.workers} workers '
+        f'({ticks / elapsed:,.0f} ticks/s)')
@@ -0,0 +1,203 @@
+"""
+Alien Invasion
+John Mead
+This program times the game's per-frame functions in headless scenarios and compares them to saved baselines.
+10-18-26
+"""
+
+import sys
+import json
+import argparse
+import tracemalloc
+from pathlib import Path
+from time import perf_counter_ns
+from settings import Settings
+from input_source import ScriptedInput
+from alien_invasion import AlienInvasion
+
+SCREEN_SIZES = ((800, 600), (1200, 800), (1920, 1080))
+
+
+def build_game(screen_w, screen_h):
+    """Creates a headless game that is ready to play at the given screen size.
+
+    Args:
+        screen_w (int): Width of the screen.
+        screen_h (int): Height of the screen.
+
+    Returns:
+        AlienInvasion: The game with an active round.
+    """
+    settings = Settings()
+    settings.screen_w = screen_w
+    settings.screen_h = screen_h
+    settings.persist_scores = False
+    game = AlienInvasion(settings, headless=True, input_source=ScriptedInput([]))
+    game.restart_game()
+    return game
+
+
+def full_fleet(game):
+    """Resets the scenario to a fresh fleet with no bullets or power-ups.
+
+    Args:
+        game (AlienInvasion): The game to set up.
+    """
+    game._reset_level()
+    game.ship._center_ship()
+
+
+def max_bullets(game):
+    """Resets the scenario to a fresh fleet with the arsenal full of bullets.
+
+    Args:
+        game (AlienInvasion): The game to set up.
+    """
+    full_fleet(game)
+    while game.ship.fire():
+        game.ship.arsenal.update_arsenal()
+
+
+def powerups_active(game):
+    """Resets the scenario to a full powered-up arsenal with power-ups on screen.
+
+    Args:
+        game (AlienInvasion): The game to set up.
+    """
+    full_fleet(game)
+    game.ship.activate_powerup()
+    for alien in game.alien_fleet.fleet:
+        game._create_powerup(alien.rect.center)
+    while game.ship.fire():
+        game.ship.arsenal.update_arsenal()
+
+
+SCENARIOS = {
+    'full_fleet': full_fleet,
+    'max_bullets': max_bullets,
+    'powerups_active': powerups_active,
+}
+
+TARGETS = {
+    'AlienFleet.update_fleet': lambda game: game.alien_fleet.update_fleet(),
+    'AlienFleet.check_collisions': lambda game: game.alien_fleet.check_collisions(game.ship.arsenal.arsenal),
+    'Arsenal.update_arsenal': lambda game: game.ship.arsenal.update_arsenal(),
+    'HUD.update_scores': lambda game: game.HUD.update_scores(),
+    'AlienInvasion._update_screen': lambda game: game._update_screen(),
+}
+
+
+def time_target(game, setup, target, iterations, reset_every):
+    """Times single calls of a target, restoring the scenario at a fixed interval.
+
+    Args:
+        game (AlienInvasion): The game to run the target against.
+        setup (function): Restores the scenario.
+        target (function): The function under test.
+        iterations (int): How many calls to time.
+        reset_every (int): Calls between scenario resets.
+
+    Returns:
+        dict: Mean and 99th percentile time in microseconds, and mean bytes allocated per call.
+    """
+    times = []
+    for i in range(iterations):
+        if i % reset_every == 0:
+            setup(game)
+        start = perf_counter_ns()
+        target(game)
+        times.append(perf_counter_ns() - start)
+
+    allocated = 0
+    alloc_iterations = max(1, iterations // 10)
+    tracemalloc.start()
+    for i in range(alloc_iterations):
+        if i % reset_every == 0:
+            setup(game)
+        tracemalloc.reset_peak()
+        before = tracemalloc.get_traced_memory()[0]
+        target(game)
+        allocated += tracemalloc.get_traced_memory()[1] - before
+    tracemalloc.stop()
+
+    times.sort()
+    return {
+        'mean_us': sum(times) / len(times) / 1000,
+        'p99_us': times[min(len(times) - 1, int(len(times) * 0.99))] / 1000,
+        'alloc_bytes': allocated / alloc_iterations,
+    }
+
+
+def run_benchmarks(iterations, reset_every, sizes=SCREEN_SIZES):
+    """Runs every target in every scenario at every screen size.
+
+    Args:
+        iterations (int): How many calls to time per target.
+        reset_every (int): Calls between scenario resets.
+        sizes (tuple, optional): The (width, height) screen sizes to test. Defaults to SCREEN_SIZES.
+
+    Returns:
+        dict: Results keyed by 'scenario@WxH:target'.
+    """
+    results = {}
+    for screen_w, screen_h in sizes:
+        game = build_game(screen_w, screen_h)
+        for scenario, setup in SCENARIOS.items():
+            for name, target in TARGETS.items():
+                key = f'{scenario}@{screen_w}x{screen_h}:{name}'
+                results[key] = time_target(game, setup, target, iterations, reset_every)
+    return results
+
+
+def print_results(results, baseline=None, threshold=0.1):
+    """Prints the results as a table and compares them to a baseline if one is given.
+
+    Args:
+        results (dict): The benchmark results.
+        baseline (dict, optional): Saved results to compare against. Defaults to None.
+        threshold (float, optional): Allowed slowdown of the mean before it counts as a regression. Defaults to 0.1.
+
+    Returns:
+        list[str]: The keys that regressed.
+    """
+    regressions = []
+    print(f'{"benchmark":<72}{"mean us":>10}{"p99 us":>10}{"alloc B":>10}{"vs base":>10}')
+    for key, result in results.items():
+        change = ''
+        if baseline and key in baseline:
+            ratio = result['mean_us'] / max(baseline[key]['mean_us'], 1e-9)
+            change = f'{ratio:.2f}x'
+            if ratio > 1 + threshold:
+                regressions.append(key)
+                change += ' !'
+        print(f'{key:<72}{result["mean_us"]:>10.1f}{result["p99_us"]:>10.1f}'
+            f'{result["alloc_bytes"]:>10.0f}{change:>10}')
+    return regressions
+
+
+def _parse_args():
+    """Reads the command line options.
+
+    Returns:
+        argparse.Namespace: The parsed options.
+    """
+    parser = argparse.ArgumentParser(description='Benchmark the Alien Invasion frame functions.')
+    parser.add_argument('--iterations', type=int, default=500, help='timed calls per target')
+    parser.add_argument('--reset-every', type=int, default=50, help='calls between scenario resets')
+    parser.add_argument('--save', type=Path, help='write the results to this baseline file')
+    parser.add_argument('--compare', type=Path, help='compare against this baseline file')
+    parser.add_argument('--threshold', type=float, default=0.1,
+        help='allowed slowdown before a result counts as a regression')
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = _parse_args()
+    results = run_benchmarks(args.iterations, args.reset_every)
+    baseline = json.loads(args.compare.read_text()) if args.compare else None
+    regressions = print_results(results, baseline, args.threshold)
+    if args.save:
+        args.save.write_text(json.dumps(results, indent = 4))
+    if regressions:
+        print(f'{len(regressions)} regression(s) over {args.threshold:.0%}')
+        sys.exit(1)
@@ -5,7 +5,6 @@ This module handles the bullet class and all it's functions.
 7-26-25
 """
 
-import pygame
 from pygame.sprite import Sprite
 from typing import TYPE_CHECKING
 
@@ -16,23 +15,33 @@ class Bullet(Sprite):
     """Manages the bullets fired from the ship.
     """
     def __init__(self, game: 'AlienInvasion'):
-        """Initializes the bullets and determines it's location.
+        """Initializes the bullet. It is placed when it is fired.
 
         Args:
             game (AlienInvasion): The main game object.
         """
         super().__init__()
 
-        self.screen = game.screen
         self.settings = game.settings
 
-        self.image = pygame.image.load(self.settings.bullet_file)
-        self.image = pygame.transform.scale(self.image, 
-            (self.settings.bullet_h, self.settings.bullet_w)                            
+        self.image = game.assets.get_image(self.settings.bullet_file,
+            (self.settings.bullet_h, self.settings.bullet_w)
+            )
+        self.mask = game.assets.get_mask(self.settings.bullet_file,
+            (self.settings.bullet_h, self.settings.bullet_w)
             )
         
         self.rect  = self.image.get_rect()
-        self.rect.midleft = game.ship.rect.midright
+        self.x = float(self.rect.x)
+
+
+    def fire(self, start):
+        """Moves the bullet to where it is fired from.
+
+        Args:
+            start (tuple): The (x, y) point the bullet's left side starts at.
+        """
+        self.rect.midleft = start
         self.x = float(self.rect.x)
 
 
@@ -41,9 +50,3 @@ class Bullet(Sprite):
         """
         self.x += self.settings.bullet_speed
         self.rect.x = self.x
-
-
-    def draw_bullet(self):
-        """Draws the bullet onto the screen.
-        """
-        self.screen.blit(self.image, self.rect)
@@ -24,7 +24,6 @@ class Button:
             msg (str): The text displayed on the button.
         """
         self.game = game
-        self.screen = game.screen
         self.boundaries = game.screen.get_rect()
         self.settings = game.settings
         self.font = pygame.font.Font(self.settings.font_file,
@@ -48,9 +47,12 @@ class Button:
     
     def draw(self):
         """Draws the button color and text onto the screen.
+
+        Returns:
+            list[pygame.Rect]: The areas drawn on.
         """
-        self.screen.fill(self.settings.button_color, self.rect)
-        self.screen.blit(self.msg_image,self.msg_image_rect)
+        return [self.game.window.fill(self.settings.button_color, self.rect),
+            self.game.window.blit(self.msg_image,self.msg_image_rect)]
 
 
     def check_clicked(self, mouse_pos):
@@ -0,0 +1,340 @@
+"""
+Alien Invasion
+John Mead
+This module handles the reinforcement learning environment classes and all it's functions.
+10-18-26
+"""
+
+import random
+import argparse
+import numpy as np
+from time import perf_counter
+from settings import Settings
+from input_source import InputState
+from alien_invasion import AlienInvasion
+from pixel_observer import PixelObserver
+
+ACTIONS = tuple(InputState(move == 1, move == 2, fire) for fire in (False, True) for move in range(3))
+OBSERVATION_SIZE = 14
+
+
+def default_settings():
+    """Makes the settings an environment uses when it is not given any. They use the
+    NumPy fleet backend, since the sprite backend moves each alien in Python and is
+    too slow to reach tens of thousands of steps per second.
+
+    Returns:
+        Settings: The default settings with the NumPy fleet backend.
+    """
+    settings = Settings()
+    settings.fleet_backend = 'numpy'
+    return settings
+
+
+class AlienInvasionEnv:
+    """Runs one headless game one tick per step for a learning agent, Gym style.
+
+    Actions are indexes into ACTIONS: stay, up, or down, each with or without
+    firing. Observations are OBSERVATION_SIZE floats, mostly scaled to between
+    0 and 1, describing the ship, the fleet, and the power-ups. With a pixel
+    observer they are the newest drawn frames instead, stacked oldest first.
+    The reward is the points scored in the step, less ship_penalty for each
+    ship lost.
+    """
+    def __init__(self, settings=None, max_ticks=36000, ship_penalty=500, pixels=None) -> None:
+        """Initializes the headless game.
+
+        Args:
+            settings (Settings, optional): Settings to use instead of the defaults. Scores are
+                never saved from an environment. Defaults to None, which uses
+                default_settings(). The step rate target needs the NumPy fleet backend.
+            max_ticks (int, optional): Ticks before an episode is cut short. Defaults to 36000.
+            ship_penalty (float, optional): Reward taken away for each ship lost. Defaults to 500.
+            pixels (dict, optional): PixelObserver options (size, grayscale, stack) to observe
+                drawn frames with. Defaults to None, which observes the game state.
+        """
+        settings = settings or default_settings()
+        settings.persist_scores = False
+        self.game = AlienInvasion(settings, headless=True)
+        self.settings = self.game.settings
+        self.max_ticks = max_ticks
+        self.ship_penalty = ship_penalty
+        self.pixels = None
+        if pixels is not None:
+            self.pixels = PixelObserver(self.game.screen, **pixels)
+            self.observation_shape = self.pixels.shape
+        else:
+            self.observation_shape = (OBSERVATION_SIZE,)
+        self.observation = np.zeros(OBSERVATION_SIZE, dtype=np.float32)
+
+
+    def reset(self, seed=None, out=None):
+        """Starts a new episode.
+
+        Args:
+            seed (int, optional): Seed for the game's random numbers. It also seeds where
+                the seeds of later episodes come from, so a run can be repeated. Defaults
+                to None, which takes the next seed from the last one given or Settings.seed.
+            out (numpy.ndarray, optional): Array to write the observation into. Defaults to None,
+                which uses the environment's own array.
+
+        Returns:
+            numpy.ndarray: The first observation. It is overwritten by the next call.
+        """
+        if seed is not None:
+            self.game.seeds = random.Random(seed)
+        self.game.restart_game(seed)
+        if self.pixels is not None:
+            self.game._draw_frame()
+            return self._copy_out(self.pixels.reset(), out)
+        return self.observe(out)
+
+
+    def step(self, action, out=None):
+        """Plays one tick with the chosen action.
+
+        Args:
+            action (int): Index into ACTIONS.
+            out (numpy.ndarray, optional): Array to write the observation into. Defaults to None,
+                which uses the environment's own array.
+
+        Returns:
+            tuple: The observation, the reward, whether the episode is over, and a dict
+                with the score and whether the episode was cut short by max_ticks.
+        """
+        stats = self.game.game_stats
+        score = stats.score
+        ships_lost = stats.ships_lost
+        self.game.step(ACTIONS[action])
+
+        reward = stats.score - score - self.ship_penalty * (stats.ships_lost - ships_lost)
+        truncated = self.game.game_active and stats.ticks >= self.max_ticks
+        done = truncated or not self.game.game_active
+        if self.pixels is not None:
+            self.game._draw_frame()
+            observation = self._copy_out(self.pixels.capture(), out)
+        else:
+            observation = self.observe(out)
+        return observation, reward, done, {'score': stats.score, 'truncated': truncated}
+
+
+    def _copy_out(self, frames, out):
+        """Copies stacked frames into an array when one is given.
+
+        Args:
+            frames (numpy.ndarray): The pixel observer's stacked frames.
+            out (numpy.ndarray): Array to copy them into, or None.
+
+        Returns:
+            numpy.ndarray: The array holding the frames.
+        """
+        if out is None:
+            return frames
+        np.copyto(out, frames)
+        return out
+
+
+    def observe(self, out=None):
+        """Describes the current state of the game.
+
+        Args:
+            out (numpy.ndarray, optional): Array to write the observation into. Defaults to None,
+                which uses the environment's own array.
+
+        Returns:
+            numpy.ndarray: The observation.
+        """
+        if out is None:
+            out = self.observation
+        game = self.game
+        settings = self.settings
+        ship = game.ship
+        fleet = game.alien_fleet
+        grid = fleet.grid
+        screen_w = settings.screen_w
+        screen_h = settings.screen_h
+
+        if grid.count:
+            fleet_edges = (grid.left() / screen_w, grid.top() / screen_h, grid.bottom() / screen_h)
+        else:
+            fleet_edges = (1.0, 0.0, 0.0)
+        powerup_left = ship.powerup_ticks_left * 1000 / (settings.powerup_duration * settings.FPS) \
+            if ship.powerup_active else 0.0
+        # One assignment of the whole row is much cheaper than fourteen single items.
+        out[:] = (
+            ship.rect.centery / screen_h,
+            *fleet_edges,
+            fleet.fleet_y_direction,
+            grid.count / max(len(fleet.aliens), 1),
+            len(ship.arsenal.arsenal) / settings.bullet_amount,
+            powerup_left,
+            game.game_stats.ships_left / settings.starting_ship_count,
+            game.respawn_ticks > 0,
+            *self._nearest_powerup(),
+            *self._line_of_fire(),
+        )
+        return out
+
+
+    def _nearest_powerup(self):
+        """Finds the closest power-up to the ship.
+
+        Returns:
+            tuple: Its horizontal and vertical distance from the ship as fractions of the
+                screen, or (0, 0) if there are none.
+        """
+        ship = self.game.ship.rect
+        nearest = (0.0, 0.0)
+        best = None
+        for powerup in self.game.powerups:
+            dx = powerup.rect.centerx - ship.centerx
+            dy = powerup.rect.centery - ship.centery
+            distance = dx * dx + dy * dy
+            if best is None or distance < best:
+                best = distance
+                nearest = (dx / self.settings.screen_w, dy / self.settings.screen_h)
+        return nearest
+
+
+    def _line_of_fire(self):
+        """Looks along the rows of the fleet in front of the ship.
+
+        Returns:
+            tuple: The fraction of the fleet in those rows, and how far away the closest of
+                them is as a fraction of the screen width, or 1 if there are none.
+        """
+        ship = self.game.ship.rect
+        grid = self.game.alien_fleet.grid
+        first_row = max(int((ship.top - grid.origin_y) // grid.cell_h), 0)
+        last_row = min(int((ship.bottom - 1 - grid.origin_y) // grid.cell_h), grid.rows - 1)
+
+        count = 0
+        first_col = grid.cols
+        for row in range(first_row, last_row + 1):
+            if not grid.row_counts[row]:
+                continue
+            count += grid.row_counts[row]
+            start = row * grid.cols
+            for col in range(grid.min_col, first_col):
+                if grid.cells[start + col] is not None:
+                    first_col = col
+                    break
+        if not count:
+            return 0.0, 1.0
+        distance = grid.origin_x + first_col * grid.cell_w - ship.right
+        return count / max(grid.count, 1), distance / self.settings.screen_w
+
+
+class VectorEnv:
+    """Steps many independent games in one call and stacks their results into NumPy arrays.
+
+    A game that finishes is reset straight away, so every row always holds a
+    live episode. The arrays are created once and overwritten by every call.
+    """
+    def __init__(self, num_envs, settings_factory=default_settings, max_ticks=36000, ship_penalty=500,
+            pixels=None) -> None:
+        """Initializes the games and the result arrays.
+
+        Args:
+            num_envs (int): How many games to run side by side.
+            settings_factory (function, optional): Makes the settings for each game, since each
+                game changes its own settings as it levels up. Defaults to default_settings,
+                which uses the NumPy fleet backend the step rate target needs.
+            max_ticks (int, optional): Ticks before an episode is cut short. Defaults to 36000.
+            ship_penalty (float, optional): Reward taken away for each ship lost. Defaults to 500.
+            pixels (dict, optional): PixelObserver options to observe drawn frames with.
+                Defaults to None, which observes the game state.
+        """
+        self.envs = [AlienInvasionEnv(settings_factory(), max_ticks, ship_penalty, pixels)
+            for _ in range(num_envs)]
+        dtype = np.float32 if pixels is None else np.uint8
+        self.observations = np.zeros((num_envs,) + self.envs[0].observation_shape, dtype=dtype)
+        self.rewards = np.zeros(num_envs, dtype=np.float32)
+        self.dones = np.zeros(num_envs, dtype=bool)
+        self.truncated = np.zeros(num_envs, dtype=bool)
+        self.scores = np.zeros(num_envs, dtype=np.int64)
+
+
+    def __len__(self):
+        """Returns how many games are running.
+        """
+        return len(self.envs)
+
+
+    def reset(self, seed=None):
+        """Starts a new episode in every game.
+
+        Args:
+            seed (int, optional): Seed of the first game, the rest counting up from it. Each
+                game's later episodes are seeded from its own seed. Defaults to None, which
+                gives each game its next seed.
+
+        Returns:
+            numpy.ndarray: One observation row per game.
+        """
+        for index, env in enumerate(self.envs):
+            env.reset(None if seed is None else seed + index, self.observations[index])
+        return self.observations
+
+
+    def step(self, actions):
+        """Plays one tick in every game.
+
+        Args:
+            actions (Sequence[int]): One index into ACTIONS per game.
+
+        Returns:
+            tuple: The observations, rewards, and done flags, one row per game, and a dict
+                holding the score each game had when its step ended and which games were
+                cut short. A done game's observation is the first of its next episode.
+        """
+        observations = self.observations
+        for index, (env, action) in enumerate(zip(self.envs, actions)):
+            row = observations[index]
+            _, reward, done, info = env.step(action, row)
+            self.rewards[index] = reward
+            self.dones[index] = done
+            self.truncated[index] = info['truncated']
+            self.scores[index] = info['score']
+            if done:
+                env.reset(out=row)
+        return observations, self.rewards, self.dones, {'score': self.scores, 'truncated': self.truncated}
+
+
+def _parse_args():
+    """Reads the command line options.
+
+    Returns:
+        argparse.Namespace: The parsed options.
+    """
+    parser = argparse.ArgumentParser(description='Measure the vectorized environment step rate.')
+    parser.add_argument('--envs', type=int, default=16, help='games to step side by side')
+    parser.add_argument('--steps', type=int, default=2000, help='vector steps to time')
+    parser.add_argument('--backend', choices=('sprite', 'numpy'), default='numpy', help='fleet backend')
+    parser.add_argument('--seed', type=int, default=0, help='seed of the first game')
+    parser.add_argument('--pixels', type=int, nargs=2, metavar=('W', 'H'),
+        help='observe grayscale frames downsampled to this size, four to a stack')
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = _parse_args()
+
+    def make_settings():
+        settings = default_settings()
+        settings.fleet_backend = args.backend
+        return settings
+
+    pixels = {'size': tuple(args.pixels)} if args.pixels else None
+    envs = VectorEnv(args.envs, make_settings, pixels=pixels)
+    envs.reset(args.seed)
+    rng = np.random.default_rng(args.seed)
+    actions = rng.integers(len(ACTIONS), size=(args.steps, args.envs))
+    episodes = 0
+    start = perf_counter()
+    for step_actions in actions:
+        episodes += int(envs.step(step_actions)[2].sum())
+    elapsed = perf_counter() - start
+    steps = args.steps * args.envs
+    print(f'{steps:,} env steps in {elapsed:.2f}s ({steps / elapsed:,.0f} steps/s), '
+        f'{episodes} episodes finished')
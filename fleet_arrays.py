@@ -0,0 +1,93 @@
+"""
+Alien Invasion
+John Mead
+This module handles the fleet arrays class and all it's functions.
+10-18-26
+"""
+
+import numpy as np
+
+
+class FleetArrays:
+    """Stores the fleet's positions and alive flags in NumPy arrays so the whole fleet moves at once.
+    """
+    def __init__(self, alien_w, alien_h) -> None:
+        """Initializes an empty set of fleet arrays.
+
+        Args:
+            alien_w (int): Width of a single alien.
+            alien_h (int): Height of a single alien.
+        """
+        self.alien_w = alien_w
+        self.alien_h = alien_h
+        self.x = np.zeros(0)
+        self.y = np.zeros(0)
+        self.alive = np.zeros(0, dtype=bool)
+
+
+    def reset(self, xs, ys):
+        """Replaces the fleet with aliens at the given positions, reusing the arrays when the size matches.
+
+        Args:
+            xs (list[float]): The x-coordinate of each alien.
+            ys (list[float]): The y-coordinate of each alien.
+        """
+        if len(xs) == len(self.x):
+            self.x[:] = xs
+            self.y[:] = ys
+            self.alive[:] = True
+            return
+        self.x = np.array(xs, dtype=np.float64)
+        self.y = np.array(ys, dtype=np.float64)
+        self.alive = np.ones(len(self.x), dtype=bool)
+
+
+    def __len__(self):
+        """Returns how many aliens are still alive.
+        """
+        return int(np.count_nonzero(self.alive))
+
+
+    def move(self, dx, dy):
+        """Moves every alien by the same amount.
+
+        Args:
+            dx (float): Horizontal distance to move.
+            dy (float): Vertical distance to move.
+        """
+        if dx:
+            self.x += dx
+        if dy:
+            self.y += dy
+
+
+    def rect_x(self):
+        """Returns the integer left edge of each alien, rounded the same way pygame.Rect does.
+        """
+        return np.trunc(self.x + np.copysign(0.5, self.x))
+
+
+    def rect_y(self):
+        """Returns the integer top edge of each alien, rounded the same way pygame.Rect does.
+        """
+        return np.trunc(self.y + np.copysign(0.5, self.y))
+
+
+    def positions(self):
+        """Returns the integer top-left corner of each living alien.
+
+        Returns:
+            list[tuple[int, int]]: The positions in creation order.
+        """
+        xs = self.rect_x()[self.alive].astype(np.int64)
+        ys = self.rect_y()[self.alive].astype(np.int64)
+        return list(zip(xs.tolist(), ys.tolist()))
+
+
+    def kill(self, index):
+        """Marks an alien as destroyed.
+
+        Args:
+            index (int): The index of the alien.
+        """
+        self.alive[index] = False
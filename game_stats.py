@@ -5,7 +5,8 @@ This module handles the game statistics class and all it's functions.
 7-26-25
 """
 
-import json
+from datetime import datetime
+from score_store import ScoreStore
 
 from typing import TYPE_CHECKING
 
@@ -30,34 +31,58 @@ class Gamestats():
 
     def init_saved_scores(self):
         """Loads the saved hi score or creates a json file to savew to if it doesn't exist.
+        Nothing is read or written in headless runs or when the settings turn off saving scores.
         """
         self.path = self.settings.scores_file
-        if self.path.exists() and self.path.stat.__sizeof__() > 20:
-            contents = self.path.read_text()
-            scores = json.loads(contents)
-            self.hi_score = scores.get('hi_score', 0)
-        else:
-            self.hi_score = 0
-            self.save_scores()
+        self.hi_score = 0
+        self.store = None
+        if not self.settings.persist_scores or self.game.headless:
+            return
+
+        self.store = ScoreStore(self.path, self.settings.history_file,
+            self.settings.score_save_delay)
+        scores = self.store.load()
+        self.hi_score = scores.get('hi_score', 0)
+        if not scores:
+            self._queue_save()
+
+
+    def _queue_save(self):
+        """Hands the high score to the background writer without waiting for the disk.
+        """
+        if self.store is not None:
+            self.store.save({'hi_score': self.hi_score})
 
 
     def save_scores(self):
-        """Saves the high score to a json file.
+        """Saves the high score to a json file, waits for the write to finish, and stops
+        the background writer.
+        """
+        self._queue_save()
+        if self.store is not None:
+            self.store.close()
+
+
+    def record_game(self):
+        """Adds the finished game to the score history.
         """
-        scores = {
-            'hi_score': self.hi_score
-        }
-        contents = json.dumps(scores, indent = 4)
-        try:
-            self.path.write_text(contents)
-        except FileNotFoundError as e:
-            print(f"File Not Found: {e}")
+        if self.store is not None:
+            self.store.append_history({
+                'finished': datetime.now().isoformat(timespec='seconds'),
+                'score': self.score,
+                'level': self.level,
+                'ships_lost': self.ships_lost,
+                'ticks': self.ticks,
+                'hi_score': self.hi_score,
+            })
 
 
     def reset_stats(self):
         """Resets the game's stats to start a new game.
         """
         self.ships_left = self.settings.starting_ship_count
+        self.ships_lost = 0
+        self.ticks = 0
         self.score = 0
         self.level = 1
 
@@ -85,6 +110,7 @@ class Gamestats():
         """
         if self.score > self.hi_score:
             self.hi_score = self.score
+            self._queue_save()
 
 
     def _update_score(self, collisions):
@@ -6,6 +6,7 @@ This module handles the Heads Up Display class and all it's functions.
 """
 
 import pygame.font
+from text_cache import TextCache
 
 class HUD:
     """A class to manage the Heads Up Display. Scores, Levels, and Lives.
@@ -18,11 +19,12 @@ class HUD:
         """
         self.game = game
         self.settings = game.settings
-        self.screen = game.screen
         self.boundaries = game.screen.get_rect()
         self.game_stats = game.game_stats
         self.font = pygame.font.Font(self.settings.font_file, 
             self.settings.HUD_font_size)
+        self.text_cache = TextCache(self.font, self.settings.text_color)
+        self.shown_values = {}
         self.padding = 20
         self.update_scores()
         self._setup_life_image()
@@ -32,15 +34,30 @@ class HUD:
     def _setup_life_image(self):
         """Loads the image used for lives and scales it.
         """
-        self.life_image = pygame.image.load(self.settings.ship_file)
-        self.life_image = pygame.transform.scale(self.life_image, (
-            self.settings.ship_w, self.settings.ship_h                                      
-            ))
+        self.life_image = self.game.assets.get_image(self.settings.ship_file,
+            (self.settings.ship_w, self.settings.ship_h)
+            )
         self.life_rect = self.life_image.get_rect()
 
 
+    def _value_changed(self, field, value):
+        """Records the value a field shows and reports whether it needs to be rendered again.
+
+        Args:
+            field (str): The name of the field.
+            value (int): The value the field should show.
+
+        Returns:
+            bool: True if the value is different from what is on screen, False otherwise.
+        """
+        if self.shown_values.get(field) == value:
+            return False
+        self.shown_values[field] = value
+        return True
+
+
     def update_scores(self):
-        """Updates all score text on the Heads Up Display
+        """Updates all score text on the Heads Up Display. Only scores that changed are rendered again.
         """
         self._update_max_score()
         self._update_score()
@@ -50,9 +67,10 @@ class HUD:
     def _update_score(self):
         """Renders the score and determines it's position.
         """
+        if not self._value_changed('score', self.game_stats.score):
+            return
         score_str = f'Score: {self.game_stats.score: ,.0f}'
-        self.score_image = self.font.render(score_str, True,
-            self.settings.text_color, None)
+        self.score_image = self.text_cache.render(score_str)
         self.score_rect = self.score_image.get_rect()
         self.score_rect.right = self.boundaries.right - self.padding
         self.score_rect.top = self.max_score_rect.bottom + self.padding
@@ -61,9 +79,10 @@ class HUD:
     def _update_max_score(self):
         """Renders the max score and determines it's position.
         """
+        if not self._value_changed('max_score', self.game_stats.max_score):
+            return
         max_score_str = f'Max-Score: {self.game_stats.max_score: ,.0f}'
-        self.max_score_image = self.font.render(max_score_str, True,
-            self.settings.text_color, None)
+        self.max_score_image = self.text_cache.render(max_score_str)
         self.max_score_rect = self.max_score_image.get_rect()
         self.max_score_rect.right = self.boundaries.right - self.padding
         self.max_score_rect.top = self.padding
@@ -72,9 +91,10 @@ class HUD:
     def _update_hi_score(self):
         """Renders the hi score and determines it's position.
         """
+        if not self._value_changed('hi_score', self.game_stats.hi_score):
+            return
         hi_score_str = f'Hi-Score: {self.game_stats.hi_score: ,.0f}'
-        self.hi_score_image = self.font.render(hi_score_str, True,
-            self.settings.text_color, None)
+        self.hi_score_image = self.text_cache.render(hi_score_str)
         self.hi_score_rect = self.hi_score_image.get_rect()
         self.hi_score_rect.midtop = (self.boundaries.centerx, self.padding)
 
@@ -82,9 +102,10 @@ class HUD:
     def _update_level(self):
         """Renders the level and determines it's position.
         """
+        if not self._value_changed('level', self.game_stats.level):
+            return
         level_str = f'Level: {self.game_stats.level: ,.0f}'
-        self.level_image = self.font.render(level_str, True,
-            self.settings.text_color, None)
+        self.level_image = self.text_cache.render(level_str)
         self.level_rect = self.level_image.get_rect()
         self.level_rect.left = self.padding
         self.level_rect.top = self.life_rect.bottom + self.padding
@@ -92,19 +113,29 @@ class HUD:
 
     def _draw_lives(self):
         """Draws ship images to communicate the player's remaining lives.
+
+        Returns:
+            list[pygame.Rect]: The areas drawn on.
         """
+        rects = []
         current_x = self.padding
         current_y = self.padding
         for _ in range(self.game_stats.ships_left):
-             self.screen.blit(self.life_image, (current_x, current_y))
+             rects.append(self.game.window.blit(self.life_image, (current_x, current_y)))
              current_x += self.life_rect.width + self.padding
+        return rects
 
 
     def draw(self):
         """Draws all the Heads Up Display items onto the screen.
+
+        Returns:
+            list[pygame.Rect]: The areas drawn on.
         """
-        self.screen.blit(self.hi_score_image, self.hi_score_rect)
-        self.screen.blit(self.max_score_image, self.max_score_rect)
-        self.screen.blit(self.score_image, self.score_rect)
-        self.screen.blit(self.level_image, self.level_rect)
-        self._draw_lives()
\ No newline at end of file
+        rects = self.game.window.blits([
+            (self.hi_score_image, self.hi_score_rect),
+            (self.max_score_image, self.max_score_rect),
+            (self.score_image, self.score_rect),
+            (self.level_image, self.level_rect),
+        ])
+        return rects + self._draw_lives()
\ No newline at end of file
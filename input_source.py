@@ -0,0 +1,71 @@
+"""
+Alien Invasion
+John Mead
+This module handles the programmatic input classes and all it's functions.
+10-18-26
+"""
+
+import random
+from typing import NamedTuple
+
+
+class InputState(NamedTuple):
+    """The player's input for a single tick of the game.
+    """
+    moving_up: bool = False
+    moving_down: bool = False
+    fire: bool = False
+
+
+class ScriptedInput:
+    """Plays back a fixed list of input states, looping when it runs out.
+    """
+    def __init__(self, states) -> None:
+        """Initializes the script.
+
+        Args:
+            states (list[InputState]): The input for each tick in order.
+        """
+        self.states = list(states) or [InputState()]
+        self.index = 0
+
+
+    def poll(self, game):
+        """Returns the input for the next tick.
+
+        Args:
+            game (AlienInvasion): The main game object.
+
+        Returns:
+            InputState: The scripted input.
+        """
+        state = self.states[self.index % len(self.states)]
+        self.index += 1
+        return state
+
+
+class RandomInput:
+    """Picks a random movement each tick and fires at a set rate.
+    """
+    def __init__(self, seed=None, fire_chance=0.2) -> None:
+        """Initializes the random input.
+
+        Args:
+            seed (int, optional): Seed for the random choices. Defaults to None.
+            fire_chance (float, optional): Chance to fire on any tick. Defaults to 0.2.
+        """
+        self.random = random.Random(seed)
+        self.fire_chance = fire_chance
+
+
+    def poll(self, game):
+        """Returns a random input for the next tick.
+
+        Args:
+            game (AlienInvasion): The main game object.
+
+        Returns:
+            InputState: The random input.
+        """
+        move = self.random.randrange(3)
+        return InputState(move == 1, move == 2, self.random.random() < self.fire_chance)
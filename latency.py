@@ -0,0 +1,114 @@
+"""
+Alien Invasion
+John Mead
+This module handles the input latency tracker class and all it's functions.
+10-18-26
+"""
+
+import numpy as np
+from collections import deque
+from time import perf_counter
+
+
+class LatencyTracker:
+    """Times each key press from when the game reads it, to the tick that uses it, to the flip
+    that shows it, and keeps the results in a ring buffer.
+
+    Fire presses are used one per tick in the order they were made, while
+    movement presses are all used by the next tick. Every method returns
+    straight away when the tracker is disabled.
+    """
+    STAGES = ('update', 'flip')
+
+    def __init__(self, enabled=False, capacity=600) -> None:
+        """Initializes an empty history.
+
+        Args:
+            enabled (bool, optional): Records latencies when True. Defaults to False.
+            capacity (int, optional): How many presses of history to keep. Defaults to 600.
+        """
+        self.enabled = enabled
+        self.capacity = capacity
+        self.history = np.zeros((capacity, len(self.STAGES)))
+        self.index = 0
+        self.presses = 0
+        self.waiting = {'fire': deque(), 'move': deque()}
+        self.applied = []
+
+
+    def received(self, kind):
+        """Stamps a key press as it is read from the event queue.
+
+        Args:
+            kind (str): 'fire' or 'move'.
+        """
+        if not self.enabled:
+            return
+        self.waiting[kind].append(perf_counter())
+
+
+    def apply(self, kind):
+        """Marks the presses a tick is about to use, the oldest fire press or every movement press.
+
+        Args:
+            kind (str): 'fire' or 'move'.
+        """
+        if not self.enabled or not self.waiting[kind]:
+            return
+        now = perf_counter()
+        if kind == 'fire':
+            self.applied.append((self.waiting[kind].popleft(), now))
+        else:
+            self.applied += [(pressed, now) for pressed in self.waiting[kind]]
+            self.waiting[kind].clear()
+
+
+    def presented(self):
+        """Records every used press once the frame showing it has been flipped.
+        """
+        if not self.enabled or not self.applied:
+            return
+        now = perf_counter()
+        for pressed, updated in self.applied:
+            self.history[self.index] = (updated - pressed, now - pressed)
+            self.index = (self.index + 1) % self.capacity
+            self.presses += 1
+        self.applied.clear()
+
+
+    def discard_waiting(self):
+        """Forgets presses that will never be used, such as when a new game starts.
+        """
+        for presses in self.waiting.values():
+            presses.clear()
+        self.applied.clear()
+
+
+    def percentiles(self, percents=(50, 95, 99)):
+        """Works out latency percentiles from the recorded presses.
+
+        Args:
+            percents (tuple, optional): The percentiles to work out. Defaults to (50, 95, 99).
+
+        Returns:
+            dict: Milliseconds for each percentile, keyed by stage then percentile,
+                or an empty dict if nothing was recorded.
+        """
+        count = min(self.presses, self.capacity)
+        if not count:
+            return {}
+        values = np.percentile(self.history[:count], percents, axis=0) * 1000
+        return {stage: dict(zip(percents, values[:, column]))
+            for column, stage in enumerate(self.STAGES)}
+
+
+    def report(self):
+        """Prints the latency percentiles for each stage.
+        """
+        results = self.percentiles()
+        if not self.enabled or not results:
+            return
+        print(f'Input latency over {min(self.presses, self.capacity)} presses:')
+        for stage, values in results.items():
+            print(f'  to {stage}: ' + ', '.join(f'p{percent} {ms:.1f} ms'
+                for percent, ms in values.items()))
@@ -0,0 +1,160 @@
+"""
+Alien Invasion
+John Mead
+This module handles the particle system class and all it's functions.
+10-18-26
+"""
+
+import pygame
+import numpy as np
+
+PALETTE = np.array([(255, 255, 255), (255, 230, 120), (255, 160, 40), (230, 70, 20)], dtype=np.int64)
+
+
+class ParticleSystem:
+    """Stores explosion particles in NumPy arrays, moves them all at once, and draws them
+    straight into the frame's pixels.
+
+    Live particles are kept packed at the front of the arrays. Explosions use
+    their own random numbers so they never change how a seeded game plays.
+    When the arrays are full new particles are dropped, and when frames go over
+    budget every explosion makes fewer particles until there is time again.
+    """
+    def __init__(self, settings, enabled=True, seed=None) -> None:
+        """Initializes the empty particle arrays.
+
+        Args:
+            settings (Settings): The game settings.
+            enabled (bool, optional): Makes and draws particles when True. Defaults to True.
+            seed (int, optional): Seed for the explosions' random numbers. Defaults to None.
+        """
+        self.settings = settings
+        self.enabled = enabled
+        self.capacity = settings.particle_capacity
+        self.rng = np.random.default_rng(seed)
+        self.count = 0
+        self.quality = 1.0
+        self.dropped = 0
+
+        self.x = np.zeros(self.capacity)
+        self.y = np.zeros(self.capacity)
+        self.vx = np.zeros(self.capacity)
+        self.vy = np.zeros(self.capacity)
+        self.life = np.zeros(self.capacity, dtype=np.int32)
+        self.color = np.zeros((self.capacity, 3), dtype=np.int64)
+
+
+    def __len__(self):
+        """Returns how many particles are alive.
+        """
+        return self.count
+
+
+    def clear(self):
+        """Removes every particle.
+        """
+        self.count = 0
+
+
+    def explode(self, center):
+        """Bursts particles out from a point in every direction.
+
+        Args:
+            center (tuple): The (x, y) point the explosion starts at.
+        """
+        if not self.enabled:
+            return
+        wanted = int(self.settings.particles_per_explosion * self.quality)
+        amount = min(wanted, self.capacity - self.count)
+        self.dropped += wanted - amount
+        if amount <= 0:
+            return
+
+        new = slice(self.count, self.count + amount)
+        angle = self.rng.uniform(0, 2 * np.pi, amount)
+        speed = self.rng.uniform(0.2, 1.0, amount) * self.settings.particle_speed
+        self.x[new] = center[0]
+        self.y[new] = center[1]
+        self.vx[new] = np.cos(angle) * speed
+        self.vy[new] = np.sin(angle) * speed
+        self.life[new] = self.rng.integers(self.settings.particle_lifetime // 2,
+            self.settings.particle_lifetime + 1, amount)
+        self.color[new] = PALETTE[self.rng.integers(len(PALETTE), size=amount)]
+        self.count += amount
+
+
+    def update(self):
+        """Moves every particle one tick, slows it down, and removes the ones that burned out.
+        """
+        if not self.count:
+            return
+        live = slice(0, self.count)
+        self.x[live] += self.vx[live]
+        self.y[live] += self.vy[live]
+        self.vx[live] *= self.settings.particle_drag
+        self.vy[live] *= self.settings.particle_drag
+        self.life[live] -= 1
+
+        alive = self.life[live] > 0
+        remaining = int(np.count_nonzero(alive))
+        if remaining < self.count:
+            for array in (self.x, self.y, self.vx, self.vy, self.life, self.color):
+                array[:remaining] = array[live][alive]
+            self.count = remaining
+
+
+    def draw(self, screen, alpha=1.0, scale=1.0):
+        """Writes every particle into the screen's pixels as a small square, fading it as it
+        burns out.
+
+        Args:
+            screen (pygame.Surface): The 32 bit surface to draw on.
+            alpha (float, optional): Fraction of a tick to draw the particles ahead of
+                their last position. Defaults to 1.0.
+            scale (float, optional): Screen pixels per frame pixel. Defaults to 1.0.
+
+        Returns:
+            list[pygame.Rect]: The area drawn on, or an empty list if there are no particles.
+        """
+        if not self.count:
+            return []
+        live = slice(0, self.count)
+        back = alpha - 1
+        xs = ((self.x[live] + self.vx[live] * back) * scale).astype(np.int64)
+        ys = ((self.y[live] + self.vy[live] * back) * scale).astype(np.int64)
+        size = max(1, round(self.settings.particle_size * scale))
+        width, height = screen.get_size()
+        inside = (xs >= 0) & (xs <= width - size) & (ys >= 0) & (ys <= height - size)
+        if not inside.any():
+            return []
+        xs = xs[inside]
+        ys = ys[inside]
+
+        fade = np.minimum(self.life[live][inside], self.settings.particle_fade)
+        colors = self.color[live][inside] * fade[:, None] // self.settings.particle_fade
+        r_shift, g_shift, b_shift, _ = screen.get_shifts()
+        mapped = (colors[:, 0] << r_shift) | (colors[:, 1] << g_shift) | (colors[:, 2] << b_shift)
+
+        pixels = pygame.surfarray.pixels2d(screen)
+        for dx in range(size):
+            for dy in range(size):
+                pixels[xs + dx, ys + dy] = mapped
+        del pixels
+        left, top = int(xs.min()), int(ys.min())
+        return [pygame.Rect(left, top, int(xs.max()) - left + size, int(ys.max()) - top + size)]
+
+
+    def check_budget(self, frame_time):
+        """Makes fewer particles per explosion while frames are over budget and more once
+        there is time to spare.
+
+        Args:
+            frame_time (float): Seconds the last frame took.
+        """
+        if not self.enabled:
+            return
+        budget = 1 / self.settings.render_fps
+        if frame_time > budget:
+            self.quality = max(self.quality / 2, self.settings.particle_min_quality)
+        elif frame_time < budget * 0.75:
+            self.quality = min(self.quality + 0.05, 1.0)
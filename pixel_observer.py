@@ -0,0 +1,102 @@
+"""
+Alien Invasion
+John Mead
+This module handles the pixel observer class and all it's functions.
+10-18-26
+"""
+
+import pygame
+import numpy as np
+
+
+class PixelObserver:
+    """Turns the game's frame into stacked NumPy pixel observations without allocating per frame.
+
+    The frame is read through a pygame.surfarray view, so its pixels are never
+    copied out of the surface. Downsampling scales into a small surface that is
+    made once, by nearest neighbour unless smooth scaling is asked for, which
+    keeps thin sprites but costs many times more. Grayscale is worked out in
+    integer buffers that are also made once. Each frame is written into the
+    stack twice, at its slot and at its slot plus the stack depth, so the
+    newest frames are always one contiguous slice of the buffer and can be
+    returned as a view, oldest first.
+    """
+    def __init__(self, surface, size=None, grayscale=True, stack=4, smooth=False) -> None:
+        """Initializes the buffers.
+
+        Args:
+            surface (pygame.Surface): The frame to observe. It must be 24 or 32 bits per pixel.
+            size (tuple, optional): The (width, height) to downsample to. Defaults to None,
+                which keeps the frame's size.
+            grayscale (bool, optional): Keeps one brightness channel instead of three. Defaults to True.
+            stack (int, optional): How many of the newest frames each observation holds. Defaults to 4.
+            smooth (bool, optional): Averages pixels when downsampling instead of picking the
+                nearest one. Defaults to False.
+        """
+        self.surface = surface
+        self.grayscale = grayscale
+        self.stack = stack
+        self.smooth = smooth
+        self.small = None
+        if size is not None and tuple(size) != surface.get_size():
+            self.small = pygame.Surface(size, 0, surface)
+        w, h = size or surface.get_size()
+
+        frame_shape = (h, w) if grayscale else (h, w, 3)
+        self.shape = (stack,) + frame_shape
+        self.frames = np.zeros((stack * 2,) + frame_shape, dtype=np.uint8)
+        self.index = 0
+        if grayscale:
+            self.brightness = np.zeros((h, w), dtype=np.uint16)
+            self.channel = np.zeros((h, w), dtype=np.uint16)
+
+
+    def observation(self):
+        """Returns the stacked frames, oldest first.
+
+        Returns:
+            numpy.ndarray: A view into the stack that changes when the next frame is captured.
+        """
+        return self.frames[self.index + 1:self.index + 1 + self.stack]
+
+
+    def reset(self):
+        """Fills every slot of the stack with the current frame.
+
+        Returns:
+            numpy.ndarray: The stacked frames.
+        """
+        self.capture()
+        self.frames[:] = self.frames[self.index]
+        return self.observation()
+
+
+    def capture(self):
+        """Adds the current frame to the stack, replacing the oldest one.
+
+        Returns:
+            numpy.ndarray: The stacked frames.
+        """
+        source = self.surface
+        if self.small is not None:
+            if self.smooth:
+                pygame.transform.smoothscale(self.surface, self.small.get_size(), self.small)
+            else:
+                pygame.transform.scale(self.surface, self.small.get_size(), self.small)
+            source = self.small
+
+        self.index = (self.index + 1) % self.stack
+        slot = self.frames[self.index]
+        pixels = pygame.surfarray.pixels3d(source).transpose(1, 0, 2)
+        if self.grayscale:
+            np.multiply(pixels[..., 0], 77, out=self.brightness, dtype=np.uint16)
+            np.multiply(pixels[..., 1], 150, out=self.channel, dtype=np.uint16)
+            np.add(self.brightness, self.channel, out=self.brightness)
+            np.multiply(pixels[..., 2], 29, out=self.channel, dtype=np.uint16)
+            np.add(self.brightness, self.channel, out=self.brightness)
+            np.right_shift(self.brightness, 8, out=slot, casting='unsafe')
+        else:
+            np.copyto(slot, pixels)
+        del pixels
+        self.frames[self.index + self.stack] = slot
+        return self.observation()
@@ -5,7 +5,6 @@ This module handles the powerup class and all it's functions.
 7-26-25
 """
 
-import pygame
 from pygame.sprite import Sprite
 from typing import TYPE_CHECKING
 
@@ -20,11 +19,14 @@ class PowerUp(Sprite):
         """Initialize the power-up and set its starting position.
         """
         super().__init__()
-        self.screen = game.screen
         self.settings = game.settings
 
-        self.image = pygame.image.load(self.settings.powerup_file)
-        self.image = pygame.transform.scale(self.image, (self.settings.powerup_w, self.settings.powerup_h))
+        self.image = game.assets.get_image(self.settings.powerup_file,
+            (self.settings.powerup_w, self.settings.powerup_h)
+            )
+        self.mask = game.assets.get_mask(self.settings.powerup_file,
+            (self.settings.powerup_w, self.settings.powerup_h)
+            )
         self.rect = self.image.get_rect()
 
         self.rect.center = center
@@ -37,9 +39,3 @@ class PowerUp(Sprite):
         """
         self.x -= self.settings.powerup_speed
         self.rect.x = self.x
-
-
-    def draw(self):
-        """Draw the power-up to the screen.
-        """
-        self.screen.blit(self.image, self.rect)
\ No newline at end of file
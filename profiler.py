@@ -0,0 +1,136 @@
+"""
+Alien Invasion
+John Mead
+This module handles the frame profiler class and all it's functions.
+10-18-26
+"""
+
+import json
+import pygame
+import numpy as np
+from time import perf_counter
+
+
+class FrameProfiler:
+    """Times each phase of a frame into a ring buffer, draws a graph of it, and saves it to a file.
+
+    Every method returns straight away when the profiler is disabled, so it can
+    stay in the game loop at almost no cost.
+    """
+    PHASES = ('events', 'particles', 'ship', 'powerups', 'fleet', 'collisions', 'screen')
+    COLORS = ((90, 90, 90), (255, 140, 0), (0, 170, 255), (255, 200, 0), (0, 200, 80), (255, 80, 80),
+        (200, 120, 255))
+
+    def __init__(self, enabled=False, capacity=600) -> None:
+        """Initializes an empty history.
+
+        Args:
+            enabled (bool, optional): Records timings when True. Defaults to False.
+            capacity (int, optional): How many frames of history to keep. Defaults to 600.
+        """
+        self.enabled = enabled
+        self.capacity = capacity
+        self.history = np.zeros((capacity, len(self.PHASES)))
+        self.columns = {phase: column for column, phase in enumerate(self.PHASES)}
+        self.index = 0
+        self.frames = 0
+        self.last_time = 0.0
+
+
+    def begin_frame(self):
+        """Starts timing a new frame.
+        """
+        if not self.enabled:
+            return
+        self.history[self.index] = 0.0
+        self.last_time = perf_counter()
+
+
+    def mark(self, phase):
+        """Adds the time since the last mark to a phase. A phase can be marked more than once a frame.
+
+        Args:
+            phase (str): One of PHASES.
+        """
+        if not self.enabled:
+            return
+        now = perf_counter()
+        self.history[self.index, self.columns[phase]] += now - self.last_time
+        self.last_time = now
+
+
+    def end_frame(self):
+        """Finishes the current frame and moves to the next slot in the ring buffer.
+        """
+        if not self.enabled:
+            return
+        self.index = (self.index + 1) % self.capacity
+        self.frames += 1
+
+
+    def recent(self):
+        """Returns the recorded frames, oldest first.
+
+        Returns:
+            numpy.ndarray: One row of phase times in seconds per frame.
+        """
+        if self.frames < self.capacity:
+            return self.history[:self.frames]
+        return np.roll(self.history, -self.index, axis=0)
+
+
+    def draw(self, screen, topleft, budget, width=120, height=60):
+        """Draws a stacked bar per recent frame, with a line at the frame budget.
+
+        Args:
+            screen (pygame.Surface): The surface to draw on.
+            topleft (tuple): Where to place the graph.
+            budget (float): The frame time in seconds that reaches the budget line.
+            width (int, optional): Width of the graph in pixels, one pixel per frame. Defaults to 120.
+            height (int, optional): Height of the graph in pixels. Defaults to 60.
+
+        Returns:
+            pygame.Rect: The area drawn on.
+        """
+        area = pygame.Rect(topleft, (width, height))
+        screen.fill((0, 0, 0), area)
+        budget_y = area.bottom - height // 2
+        scale = (height // 2) / budget
+
+        frames = self.recent()[-width:]
+        for x, frame in enumerate(frames, start=area.right - len(frames)):
+            bottom = area.bottom
+            for seconds, color in zip(frame, self.COLORS):
+                bar = min(int(seconds * scale), bottom - area.top)
+                if bar > 0:
+                    screen.fill(color, (x, bottom - bar, 1, bar))
+                    bottom -= bar
+        screen.fill((255, 255, 255), (area.left, budget_y, width, 1))
+        return area
+
+
+    def dump(self, path):
+        """Saves the recorded frames as CSV, or as JSON lines if the file ends in .jsonl.
+
+        Args:
+            path (Path): The file to write.
+        """
+        if not self.enabled or not self.frames:
+            return
+        first = self.frames - len(self.recent())
+        rows = []
+        for number, frame in enumerate(self.recent(), start=first):
+            times = {phase: round(seconds * 1000, 4) for phase, seconds in zip(self.PHASES, frame)}
+            times['total'] = round(float(frame.sum()) * 1000, 4)
+            rows.append((number, times))
+
+        if path.suffix == '.jsonl':
+            lines = [json.dumps({'frame': number, **times}) for number, times in rows]
+        else:
+            lines = [','.join(('frame',) + self.PHASES + ('total',))]
+            lines += [','.join([str(number)] + [str(value) for value in times.values()])
+                for number, times in rows]
+        try:
+            path.write_text('\n'.join(lines) + '\n')
+        except FileNotFoundError as e:
+            print(f"File Not Found: {e}")
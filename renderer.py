@@ -0,0 +1,61 @@
+"""
+Alien Invasion
+John Mead
+This module handles the dirty rectangle renderer class and all it's functions.
+10-18-26
+"""
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from alien_invasion import AlienInvasion
+
+class DirtyRectRenderer:
+    """Redraws only the parts of the screen that changed instead of the whole background.
+    """
+    def __init__(self, game: 'AlienInvasion') -> None:
+        """Initializes the renderer so the first frame is drawn in full.
+
+        Args:
+            game (AlienInvasion): The main game object.
+        """
+        self.game = game
+        self.previous_rects = []
+        self.paused_frame_shown = False
+        self.invalidate()
+
+
+    def invalidate(self):
+        """Makes the next frame redraw and push the whole screen.
+        """
+        self.full_redraw = True
+
+
+    def render(self, alpha=1.0):
+        """Restores the background under last frame's sprites, draws this frame, and pushes the changed areas.
+
+        While the game is paused nothing moves, so once the paused frame is on
+        screen later frames are skipped until the game starts again.
+
+        Args:
+            alpha (float, optional): Fraction of a tick to draw moving sprites ahead of
+                their last position. Defaults to 1.0.
+        """
+        paused = not self.game.game_active
+        if paused and self.paused_frame_shown and not self.full_redraw:
+            return
+
+        window = self.game.window
+        if self.full_redraw:
+            window.canvas.blit(window.background, (0, 0))
+            rects = self.game._draw_sprites(alpha)
+            window.present()
+            self.full_redraw = False
+        else:
+            for rect in self.previous_rects:
+                window.canvas.blit(window.background, rect, rect)
+            rects = self.game._draw_sprites(alpha)
+            window.present(self.previous_rects + rects)
+
+        self.previous_rects = rects
+        self.paused_frame_shown = paused
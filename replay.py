@@ -0,0 +1,122 @@
+"""
+Alien Invasion
+John Mead
+This module handles the input recorder and replay classes and all it's functions.
+10-18-26
+"""
+
+import zlib
+import struct
+from input_source import InputState
+
+MAGIC = b'AIRP'
+VERSION = 1
+HEADER = struct.Struct('<4sBIHHIq')
+
+UP = 1
+DOWN = 2
+FIRE = 4
+
+
+def pack_input(input_state):
+    """Packs one tick of input into a single byte.
+
+    Args:
+        input_state (InputState): The input to pack.
+
+    Returns:
+        int: The packed input.
+    """
+    return ((UP if input_state.moving_up else 0) | (DOWN if input_state.moving_down else 0)
+        | (FIRE if input_state.fire else 0))
+
+
+def unpack_input(value):
+    """Turns a packed byte back into an input state.
+
+    Args:
+        value (int): The packed input.
+
+    Returns:
+        InputState: The input for that tick.
+    """
+    return InputState(bool(value & UP), bool(value & DOWN), bool(value & FIRE))
+
+
+class InputRecorder:
+    """Records the input for every tick of one game so it can be replayed exactly.
+    """
+    def __init__(self, seed, screen_w, screen_h) -> None:
+        """Initializes an empty recording.
+
+        Args:
+            seed (int): The seed the game's random numbers were started with.
+            screen_w (int): Width of the screen the game was played at.
+            screen_h (int): Height of the screen the game was played at.
+        """
+        self.seed = seed
+        self.screen_w = screen_w
+        self.screen_h = screen_h
+        self.inputs = bytearray()
+
+
+    def record(self, input_state):
+        """Adds the input for one tick.
+
+        Args:
+            input_state (InputState): The input for the tick.
+        """
+        self.inputs.append(pack_input(input_state))
+
+
+    def save(self, path, final_score):
+        """Writes the recording as a small header followed by the compressed inputs.
+
+        Args:
+            path (Path): The file to write.
+            final_score (int): The score the game ended with, used to check a replay.
+        """
+        header = HEADER.pack(MAGIC, VERSION, self.seed, self.screen_w, self.screen_h,
+            len(self.inputs), final_score)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(header + zlib.compress(bytes(self.inputs)))
+        except FileNotFoundError as e:
+            print(f"File Not Found: {e}")
+
+
+class ReplayInput:
+    """Feeds a recorded game back one tick at a time.
+    """
+    def __init__(self, path) -> None:
+        """Loads a recording.
+
+        Args:
+            path (Path): The file to read.
+
+        Raises:
+            ValueError: If the file is not a recording this version can read.
+        """
+        data = path.read_bytes()
+        magic, version, self.seed, self.screen_w, self.screen_h, self.ticks, self.final_score = (
+            HEADER.unpack_from(data))
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f'{path} is not an Alien Invasion recording')
+        self.inputs = zlib.decompress(data[HEADER.size:])
+        self.index = 0
+
+
+    def poll(self, game):
+        """Returns the recorded input for the next tick, or no input once the recording ends.
+
+        Args:
+            game (AlienInvasion): The main game object.
+
+        Returns:
+            InputState: The recorded input.
+        """
+        if self.index >= len(self.inputs):
+            return InputState()
+        value = self.inputs[self.index]
+        self.index += 1
+        return unpack_input(value)
@@ -0,0 +1,153 @@
+"""
+Alien Invasion
+John Mead
+This module handles the score store class and all it's functions.
+10-18-26
+"""
+
+import os
+import json
+import threading
+from time import monotonic
+
+
+class ScoreStore:
+    """Saves scores on a background thread so the game never waits on the disk.
+
+    Saves that arrive close together are combined into one write. Each write
+    goes to a temporary file that then replaces the real one, so a crash can
+    never leave a half written scores file. Finished games are appended to a
+    history file, one JSON object per line.
+    """
+    def __init__(self, path, history_path, delay=1.0) -> None:
+        """Initializes the store and starts its writer thread.
+
+        Args:
+            path (Path): The JSON file the current scores are saved to.
+            history_path (Path): The file finished games are appended to.
+            delay (float, optional): Seconds to wait for more changes before writing. Defaults to 1.0.
+        """
+        self.path = path
+        self.history_path = history_path
+        self.delay = delay
+        self._changed = threading.Condition()
+        self._write_lock = threading.Lock()
+        self._pending = None
+        self._history = []
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name='score-store', daemon=True)
+        self._thread.start()
+
+
+    def load(self):
+        """Reads the saved scores.
+
+        Returns:
+            dict: The saved scores, or an empty dict if the file is missing, empty, or damaged.
+        """
+        try:
+            contents = self.path.read_text()
+        except FileNotFoundError:
+            return {}
+        try:
+            return json.loads(contents) if contents.strip() else {}
+        except json.JSONDecodeError:
+            return {}
+
+
+    def save(self, scores):
+        """Queues the scores to be written. Only the newest queued scores are written.
+
+        Args:
+            scores (dict): The scores to save.
+        """
+        with self._changed:
+            self._pending = dict(scores)
+            self._changed.notify()
+
+
+    def append_history(self, record):
+        """Queues a finished game to be added to the history file.
+
+        Args:
+            record (dict): The game's results.
+        """
+        with self._changed:
+            self._history.append(dict(record))
+            self._changed.notify()
+
+
+    def flush(self):
+        """Writes everything that is queued right away, waiting for it to finish.
+        """
+        with self._write_lock:
+            with self._changed:
+                scores, self._pending = self._pending, None
+                history, self._history = self._history, []
+            if scores is not None:
+                self._write_scores(scores)
+            if history:
+                self._append_history(history)
+
+
+    def close(self):
+        """Stops the writer thread and writes anything still queued.
+        """
+        with self._changed:
+            self._closed = True
+            self._changed.notify()
+        self._thread.join()
+        self.flush()
+
+
+    def _run(self):
+        """Waits for changes, gives them a short time to pile up, then writes them.
+        """
+        while True:
+            with self._changed:
+                while self._pending is None and not self._history and not self._closed:
+                    self._changed.wait()
+                deadline = monotonic() + self.delay
+                while not self._closed and monotonic() < deadline:
+                    self._changed.wait(deadline - monotonic())
+                if self._closed:
+                    return
+            self.flush()
+
+
+    def _write_scores(self, scores):
+        """Writes the scores to a temporary file and swaps it in for the real one. A failed
+        write is reported and skipped so the writer thread keeps running.
+
+        Args:
+            scores (dict): The scores to save.
+        """
+        temp_path = self.path.with_name(self.path.name + '.tmp')
+        try:
+            with open(temp_path, 'w') as file:
+                file.write(json.dumps(scores, indent = 4))
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(temp_path, self.path)
+        except FileNotFoundError as e:
+            print(f"File Not Found: {e}")
+        except OSError as e:
+            print(f"Scores Not Saved: {e}")
+
+
+    def _append_history(self, history):
+        """Adds finished games to the end of the history file.
+
+        Args:
+            history (list[dict]): The games to add.
+        """
+        lines = ''.join(json.dumps(record) + '\n' for record in history)
+        try:
+            with open(self.history_path, 'a') as file:
+                file.write(lines)
+                file.flush()
+                os.fsync(file.fileno())
+        except FileNotFoundError as e:
+            print(f"File Not Found: {e}")
+        except OSError as e:
+            print(f"History Not Saved: {e}")
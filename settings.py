@@ -17,9 +17,29 @@ class Settings:
         self.screen_w = 1200
         self.screen_h = 800
         self.FPS = 60
+        self.render_fps = 60
+        self.max_ticks_per_frame = 10
+        self.respawn_time = 0.5
+        self.render_mode = 'flip'
+        self.resizable = True
+        self.smooth_scaling = True
+        self.profile_enabled = False
+        self.profile_overlay = True
+        self.profile_frames = 600
+        self.profile_file = Path.cwd() / 'frame_profile.csv'
+        self.latency_enabled = False
+        self.latency_presses = 600
+        self.low_latency = False
         self.bg_file = Path.cwd() / 'Assets' / 'images' / 'Starbasesnow.png'
+        self.asset_cache_dir = Path.cwd() / 'Assets' / 'cache'
         self.difficulty_scale = 1.1
         self.scores_file = Path.cwd() / 'Assets' / 'file' / 'scores.json'
+        self.history_file = Path.cwd() / 'Assets' / 'file' / 'history.jsonl'
+        self.persist_scores = True
+        self.score_save_delay = 1.0
+        self.seed = None
+        self.record_replays = False
+        self.replay_dir = Path.cwd() / 'replays'
 
         self.ship_file = Path.cwd() / 'Assets' / 'images' / 'ship2(no bg).png'
         self.ship_w = 40
@@ -28,6 +48,10 @@ class Settings:
         self.bullet_file = Path.cwd() / 'Assets' / 'images' / 'laserBlast.png'
         self.laser_sound = Path.cwd() / 'Assets' / 'sound' / 'laser.mp3'        
         self.impact_sound = Path.cwd() / 'Assets' / 'sound' / 'impactSound.mp3'
+        self.sound_enabled = True
+        self.sound_volume = 0.7
+        self.laser_channels = 4
+        self.impact_channels = 4
 
         self.alien_file = Path.cwd() / 'Assets' / 'images' / 'enemy_4.png'
         self.alien_w = 40
@@ -35,6 +59,19 @@ class Settings:
         
         self.fleet_x_direction = 0
         self.fleet_y_direction = 1
+        self.fleet_backend = 'sprite'
+        self.fleet_spacing = 2
+        self.pixel_collisions = True
+
+        self.particles_enabled = True
+        self.particle_capacity = 50000
+        self.particles_per_explosion = 60
+        self.particle_lifetime = 40
+        self.particle_fade = 15
+        self.particle_size = 2
+        self.particle_speed = 4
+        self.particle_drag = 0.95
+        self.particle_min_quality = 0.1
 
         self.button_w = 200
         self.button_h = 50
@@ -49,6 +86,7 @@ class Settings:
         self.powerup_w = 25
         self.powerup_h = 25
         self.powerup_duration = 5000
+        self.powerup_chance = 0.2
 
 
     def initialize_dynamic_settings(self):
@@ -68,6 +106,7 @@ class Settings:
 
         self.powerup_speed = 3
         self.base_bullet_amount = 5
+        self.powerup_bullet_amount = 10
         self.bullet_amount = self.base_bullet_amount
   
         
@@ -11,6 +11,7 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from alien_invasion import AlienInvasion
     from arsenal import Arsenal
+    from alien_fleet import AlienFleet
 
 
 class Ship:
@@ -28,11 +29,12 @@ class Ship:
         self.screen = game.screen
         self.boundaries = self.screen.get_rect()
 
-        self.image = pygame.image.load(self.settings.ship_file)
-        self.image = pygame.transform.scale(self.image, 
-            (self.settings.ship_w, self.settings.ship_h)                            
+        self.image = game.assets.get_image(self.settings.ship_file,
+            (self.settings.ship_w, self.settings.ship_h), rotation=-90
+            )
+        self.mask = game.assets.get_mask(self.settings.ship_file,
+            (self.settings.ship_w, self.settings.ship_h), rotation=-90
             )
-        self.image = pygame.transform.rotate(self.image, -90)
         
         self.rect  = self.image.get_rect()
         self._center_ship()
@@ -41,12 +43,13 @@ class Ship:
         self.arsenal = arsenal
 
         self.powerup_active = False
-        self.powerup_timer = 0
+        self.powerup_ticks_left = 0
 
 
     def _center_ship(self):
         self.rect.midleft = self.boundaries.midleft
         self.y = float(self.rect.y)
+        self.last_y = self.y
 
 
     def update(self):
@@ -61,6 +64,7 @@ class Ship:
         """Manages the ships vertical ppsition and establishes screen boundaries.
         """
         temp_speed = self.settings.ship_speed
+        self.last_y = self.y
         if self.moving_down and self.rect.bottom < self.boundaries.bottom:
             self.y += temp_speed
         if self.moving_up and self.rect.top > self.boundaries.top:
@@ -69,11 +73,20 @@ class Ship:
         self.rect.y = self.y
 
 
-    def draw(self):
+    def draw(self, alpha=1.0):
         """Draws the ship on the screen and gives it arsenal.
+
+        Args:
+            alpha (float, optional): Fraction of a tick to draw the ship and bullets ahead of
+                their last position. Defaults to 1.0.
+
+        Returns:
+            list[pygame.Rect]: The areas drawn on.
         """
-        self.arsenal.draw()
-        self.screen.blit(self.image, self.rect)
+        rects = self.arsenal.draw(alpha)
+        offset_y = round((alpha - 1) * (self.y - self.last_y))
+        rects.append(self.game.window.blit(self.image, self.rect.move(0, offset_y)))
+        return rects
 
 
     def fire(self):
@@ -85,16 +98,16 @@ class Ship:
         return self.arsenal.fire_bullet()
     
 
-    def check_collisions(self, other_group):
-        """Checks for collisions with the ship and other sprites. Recenters ship if True.
+    def check_collisions(self, fleet):
+        """Checks for collisions with the ship and the alien fleet. Recenters ship if True.
 
         Args:
-            other_group (pygame.sprite.Group): Any sprite group the ship could collide with.
+            fleet (AlienFleet): The alien fleet the ship could collide with.
 
         Returns:
             Bool: True if a collision is detected,False otherwise.
         """
-        if pygame.sprite.spritecollideany(self, other_group):
+        if fleet.collide_rect(self.rect, self.mask):
             self._center_ship()
             return True
         return False
@@ -104,15 +117,15 @@ class Ship:
         """Activates powerup to increase bullet amount.
         """
         self.powerup_active = True
-        self.settings.bullet_amount = 10  
-        self.powerup_timer = pygame.time.get_ticks()
+        self.settings.bullet_amount = self.settings.powerup_bullet_amount
+        self.powerup_ticks_left = self.settings.powerup_duration * self.settings.FPS // 1000
 
 
     def _check_powerup_status(self):
-        """Checks if power-up is still active.
+        """Checks if power-up is still active. The power-up lasts a set number of game ticks.
         """
         if self.powerup_active:
-            current_time = pygame.time.get_ticks()
-            if current_time - self.powerup_timer > self.settings.powerup_duration:
+            self.powerup_ticks_left -= 1
+            if self.powerup_ticks_left < 0:
                 self.powerup_active = False
                 self.settings.bullet_amount = self.settings.base_bullet_amount
\ No newline at end of file
@@ -0,0 +1,118 @@
+"""
+Alien Invasion
+John Mead
+This module handles the sound bank class and all it's functions.
+10-18-26
+"""
+
+import queue
+import threading
+import pygame
+
+
+class SoundBank:
+    """Decodes each sound effect once and plays it on its own small pool of mixer channels.
+
+    Every effect has channels reserved for it, so a burst of one effect can
+    never take the channels another effect needs. An effect plays at most once
+    per tick, however many times it is asked for. Effects are decoded on a
+    background thread so they never hold up the first frame, and an effect
+    that has not finished decoding is skipped. When the bank is disabled
+    nothing is loaded and every method returns straight away, which is what
+    headless runs use.
+    """
+    def __init__(self, enabled=True) -> None:
+        """Initializes the mixer, or an empty disabled bank if the mixer cannot start.
+
+        Args:
+            enabled (bool, optional): Loads and plays sounds when True. Defaults to True.
+        """
+        self.enabled = enabled
+        self._sounds = {}
+        self._channels = {}
+        self._next_channel = {}
+        self._fadeouts = {}
+        self._played = set()
+        self._to_decode = queue.Queue()
+        self._decoder = None
+        if not enabled:
+            return
+        try:
+            pygame.mixer.init()
+        except pygame.error as e:
+            print(f"Sound Disabled: {e}")
+            self.enabled = False
+
+
+    def load(self, name, path, channels=2, volume=1.0, fadeout=0):
+        """Reserves an effect's channels and queues it to be decoded in the background.
+
+        Args:
+            name (str): The name the effect is played by.
+            path (Path): The sound file to load.
+            channels (int, optional): How many copies of the effect can play at once. Defaults to 2.
+            volume (float, optional): Volume from 0.0 to 1.0. Defaults to 1.0.
+            fadeout (int, optional): Milliseconds the effect fades out over once it starts,
+                or 0 to play it in full. Defaults to 0.
+        """
+        if not self.enabled:
+            return
+        first = sum(len(pool) for pool in self._channels.values())
+        total = first + channels
+        if pygame.mixer.get_num_channels() < total:
+            pygame.mixer.set_num_channels(total)
+        pygame.mixer.set_reserved(total)
+
+        self._channels[name] = [pygame.mixer.Channel(number) for number in range(first, total)]
+        self._next_channel[name] = 0
+        self._fadeouts[name] = fadeout
+
+        self._to_decode.put((name, path, volume))
+        if self._decoder is None:
+            self._decoder = threading.Thread(target=self._decode, name='sound-bank', daemon=True)
+            self._decoder.start()
+
+
+    def _decode(self):
+        """Decodes queued effects one at a time for as long as the game runs.
+        """
+        while True:
+            name, path, volume = self._to_decode.get()
+            try:
+                sound = pygame.mixer.Sound(path)
+                sound.set_volume(volume)
+                self._sounds[name] = sound
+            except (pygame.error, FileNotFoundError) as e:
+                print(f"Sound Not Loaded: {e}")
+
+
+    def play(self, name):
+        """Plays an effect on a free channel of its pool, or on its oldest one if they are all busy.
+
+        Args:
+            name (str): The effect to play.
+
+        Returns:
+            bool: True if the effect was started, False if it already played this tick
+                or is still being decoded.
+        """
+        sound = self._sounds.get(name)
+        if sound is None or name in self._played:
+            return False
+        self._played.add(name)
+
+        pool = self._channels[name]
+        channel = next((channel for channel in pool if not channel.get_busy()), None)
+        if channel is None:
+            channel = pool[self._next_channel[name]]
+            self._next_channel[name] = (self._next_channel[name] + 1) % len(pool)
+        channel.play(sound)
+        if self._fadeouts[name]:
+            channel.fadeout(self._fadeouts[name])
+        return True
+
+
+    def next_tick(self):
+        """Lets every effect play again. Called once at the start of each tick.
+        """
+        self._played.clear()
@@ -0,0 +1,188 @@
+"""
+Alien Invasion
+John Mead
+This module handles the spatial hash class and all it's functions.
+10-18-26
+"""
+
+import math
+import pygame
+
+MARGIN = 2
+
+
+class SpatialHash:
+    """A uniform grid that finds the aliens near a rectangle without checking the whole fleet.
+
+    The grid matches the rows and columns the fleet was built from. Because the
+    fleet moves as one piece, moving it only shifts the grid's origin. The grid
+    also counts the items in each row and column so the fleet's outer edges are
+    known without looking at every alien.
+    """
+    def __init__(self, cell_w, cell_h) -> None:
+        """Initializes an empty grid.
+
+        Args:
+            cell_w (int): Width of a cell, the width of an alien.
+            cell_h (int): Height of a cell, the height of an alien.
+        """
+        self.cell_w = cell_w
+        self.cell_h = cell_h
+        self.reset(0, 0, 0, 0)
+
+
+    def reset(self, origin_x, origin_y, cols, rows):
+        """Clears the grid and sizes it for a new fleet.
+
+        Args:
+            origin_x (float): The x-coordinate of column 0.
+            origin_y (float): The y-coordinate of row 0.
+            cols (int): Number of columns in the fleet.
+            rows (int): Number of rows in the fleet.
+        """
+        self.origin_x = origin_x
+        self.origin_y = origin_y
+        self.cols = cols
+        self.rows = rows
+        self.cells = [None] * (cols * rows)
+        self.count = 0
+        self.row_counts = [0] * rows
+        self.col_counts = [0] * cols
+        self.min_row = rows
+        self.max_row = -1
+        self.min_col = cols
+        self._bounds = None
+
+
+    def insert(self, item, col, row):
+        """Places an item in a cell.
+
+        Args:
+            item (Alien): The item to store.
+            col (int): The column of the cell.
+            row (int): The row of the cell.
+        """
+        self.cells[row * self.cols + col] = item
+        self.count += 1
+        self.row_counts[row] += 1
+        self.col_counts[col] += 1
+        self.min_row = min(self.min_row, row)
+        self.max_row = max(self.max_row, row)
+        self.min_col = min(self.min_col, col)
+        self._bounds = None
+
+
+    def remove(self, col, row):
+        """Empties a cell and moves the outer rows and columns inward if they are now empty.
+
+        Args:
+            col (int): The column of the cell.
+            row (int): The row of the cell.
+        """
+        self.cells[row * self.cols + col] = None
+        self.count -= 1
+        self.row_counts[row] -= 1
+        self.col_counts[col] -= 1
+        while self.min_row <= self.max_row and not self.row_counts[self.min_row]:
+            self.min_row += 1
+        while self.max_row >= self.min_row and not self.row_counts[self.max_row]:
+            self.max_row -= 1
+        while self.min_col < self.cols and not self.col_counts[self.min_col]:
+            self.min_col += 1
+        self._bounds = None
+
+
+    def top(self):
+        """Returns the top edge of the highest occupied row.
+        """
+        return _round_rect(self.origin_y + self.min_row * self.cell_h)
+
+
+    def bottom(self):
+        """Returns the bottom edge of the lowest occupied row.
+        """
+        return _round_rect(self.origin_y + self.max_row * self.cell_h) + self.cell_h
+
+
+    def left(self):
+        """Returns the left edge of the leftmost occupied column.
+        """
+        return _round_rect(self.origin_x + self.min_col * self.cell_w)
+
+
+    def move(self, dx, dy):
+        """Moves every cell of the grid by the same amount.
+
+        Args:
+            dx (float): Horizontal distance to move.
+            dy (float): Vertical distance to move.
+        """
+        self.origin_x += dx
+        self.origin_y += dy
+        self._bounds = None
+
+
+    def bounds(self):
+        """Returns a rectangle around the occupied cells with the same margin query()
+        searches, worked out once per move. A rectangle that misses it cannot touch
+        any item.
+
+        Returns:
+            pygame.Rect: The area, or an empty one if the grid is empty.
+        """
+        if self._bounds is None:
+            if not self.count:
+                self._bounds = pygame.Rect(0, 0, 0, 0)
+            else:
+                left = math.floor(self.origin_x + self.min_col * self.cell_w) - MARGIN
+                top = math.floor(self.origin_y + self.min_row * self.cell_h) - MARGIN
+                right = math.ceil(self.origin_x + self.cols * self.cell_w) + MARGIN
+                bottom = math.ceil(self.origin_y + (self.max_row + 1) * self.cell_h) + MARGIN
+                self._bounds = pygame.Rect(left, top, right - left, bottom - top)
+        return self._bounds
+
+
+    def query(self, rect):
+        """Finds the items in the cells a rectangle covers, plus a MARGIN pixel border for
+        items whose rectangles were rounded away from their cells. Only the occupied
+        rows and columns are searched.
+
+        Args:
+            rect (pygame.Rect): The rectangle to look around.
+
+        Returns:
+            list: The items found, in row then column order.
+        """
+        first_row = int((rect.top - MARGIN - self.origin_y) // self.cell_h)
+        if first_row < self.min_row:
+            first_row = self.min_row
+        last_row = int((rect.bottom + MARGIN - self.origin_y) // self.cell_h)
+        if last_row > self.max_row:
+            last_row = self.max_row
+        if first_row > last_row:
+            return []
+        first_col = int((rect.left - MARGIN - self.origin_x) // self.cell_w)
+        if first_col < self.min_col:
+            first_col = self.min_col
+        last_col = int((rect.right + MARGIN - self.origin_x) // self.cell_w)
+        if last_col >= self.cols:
+            last_col = self.cols - 1
+        if first_col > last_col:
+            return []
+
+        cells = self.cells
+        cols = self.cols
+        return [item for start in range(first_row * cols, (last_row + 1) * cols, cols)
+            for item in cells[start + first_col:start + last_col + 1] if item is not None]
+
+
+def _round_rect(value):
+    """Rounds a position to a whole pixel the same way pygame.Rect does.
+
+    Args:
+        value (float): The position to round.
+
+    Returns:
+        int: The rounded position.
+    """
+    return int(value + math.copysign(0.5, value))
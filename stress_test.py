@@ -0,0 +1,170 @@
+"""
+Alien Invasion
+John Mead
+This program runs headless games with very large fleets and reports how each part of the game scales.
+10-18-26
+"""
+
+import math
+import argparse
+import resource
+from multiprocessing import Pool
+from time import perf_counter
+from settings import Settings
+from input_source import RandomInput
+from alien_invasion import AlienInvasion
+
+
+class StressSettings(Settings):
+    """Settings that keep the stress test's bullet limits and power-up rate when a game restarts.
+    """
+    def __init__(self, bullet_cap, powerup_chance):
+        """Initializes the settings with the stress test's limits.
+
+        Args:
+            bullet_cap (int): The most bullets on screen, with or without a power-up.
+            powerup_chance (float): Chance that a destroyed alien drops a power-up.
+        """
+        super().__init__()
+        self.bullet_cap = bullet_cap
+        self.powerup_chance = powerup_chance
+        self.persist_scores = False
+
+
+    def initialize_dynamic_settings(self):
+        """Resets the dynamic settings, then applies the stress test's bullet limits.
+        """
+        super().initialize_dynamic_settings()
+        self.base_bullet_amount = self.bullet_cap
+        self.powerup_bullet_amount = self.bullet_cap
+        self.bullet_amount = self.bullet_cap
+
+
+def alien_size_for(target, screen_w, screen_h, spacing):
+    """Works out the alien size that puts about the target number of aliens in the fleet.
+
+    The fleet fills the right half of the screen with one alien every spacing
+    rows and columns.
+
+    Args:
+        target (int): The number of aliens wanted.
+        screen_w (int): Width of the screen.
+        screen_h (int): Height of the screen.
+        spacing (int): Rows and columns between aliens.
+
+    Returns:
+        int: The alien width and height in pixels.
+    """
+    return max(1, int(math.sqrt((screen_w / 2) * screen_h / (target * spacing * spacing))))
+
+
+def run_stress(target, args):
+    """Plays headless games with about the target number of aliens and measures them.
+
+    Args:
+        target (int): The number of aliens wanted.
+        args (argparse.Namespace): The stress test options.
+
+    Returns:
+        dict: The alien count, build time, ticks per second, microseconds per tick for each
+            phase, and the process's peak memory. Call it through measure() so the memory
+            belongs to this count alone.
+    """
+    settings = StressSettings(args.bullets, args.powerup_chance)
+    settings.screen_w = args.width
+    settings.screen_h = args.height
+    settings.fleet_backend = args.backend
+    settings.fleet_spacing = args.spacing
+    settings.alien_w = settings.alien_h = alien_size_for(target, args.width, args.height, args.spacing)
+    settings.seed = args.seed
+    settings.profile_enabled = True
+    settings.profile_frames = args.ticks
+
+    start = perf_counter()
+    game = AlienInvasion(settings, headless=True, input_source=RandomInput(args.seed, args.fire_chance))
+    game.restart_game()
+    build_ms = (perf_counter() - start) * 1000
+    aliens = len(game.alien_fleet.fleet)
+
+    ticks = 0
+    start = perf_counter()
+    while ticks < args.ticks:
+        game.restart_game()
+        while game.game_active and ticks < args.ticks:
+            game.profiler.begin_frame()
+            game.step(game.input_source.poll(game))
+            if args.render:
+                game._update_screen()
+                game.profiler.mark('screen')
+            game.profiler.end_frame()
+            ticks += 1
+    elapsed = perf_counter() - start
+
+    phases = game.profiler.recent().mean(axis=0) * 1_000_000
+    result = {
+        'aliens': aliens,
+        'alien_px': settings.alien_w,
+        'build_ms': build_ms,
+        'ticks_per_s': ticks / elapsed,
+    }
+    result.update({phase: phases[column] for phase, column in game.profiler.columns.items()
+        if phase != 'events'})
+    result['peak_rss_mb'] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    return result
+
+
+def measure(target, args):
+    """Runs the stress test for one count in a fresh process.
+
+    The peak memory of a process never goes down, so measuring every count in
+    the same process would report the largest count so far for all the counts
+    after it.
+
+    Args:
+        target (int): The number of aliens wanted.
+        args (argparse.Namespace): The stress test options.
+
+    Returns:
+        dict: The results from run_stress().
+    """
+    with Pool(1) as pool:
+        result = pool.apply(run_stress, (target, args))
+        # pygame catches SIGTERM in the worker, so it has to be shut down
+        # normally before the pool tries to terminate it.
+        pool.close()
+        pool.join()
+    return result
+
+
+def _parse_args():
+    """Reads the command line options.
+
+    Returns:
+        argparse.Namespace: The parsed options.
+    """
+    parser = argparse.ArgumentParser(description='Stress test Alien Invasion with large fleets.')
+    parser.add_argument('counts', type=int, nargs='*', default=[1000, 10000, 100000],
+        help='target alien counts to test')
+    parser.add_argument('--backend', choices=('sprite', 'numpy'), default='numpy', help='fleet backend')
+    parser.add_argument('--spacing', type=int, default=1, help='rows and columns between aliens')
+    parser.add_argument('--width', type=int, default=1200, help='screen width')
+    parser.add_argument('--height', type=int, default=800, help='screen height')
+    parser.add_argument('--bullets', type=int, default=50, help='bullet limit')
+    parser.add_argument('--powerup-chance', type=float, default=0.2, help='power-up drop chance')
+    parser.add_argument('--fire-chance', type=float, default=0.5, help='chance to fire each tick')
+    parser.add_argument('--ticks', type=int, default=300, help='ticks to simulate per count')
+    parser.add_argument('--render', action='store_true', help='draw every tick as well')
+    parser.add_argument('--seed', type=int, default=0, help='seed for the game and the input')
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = _parse_args()
+    columns = ('aliens', 'alien_px', 'build_ms', 'ticks_per_s', 'ship', 'powerups', 'fleet',
+        'collisions', 'screen', 'peak_rss_mb')
+    print(''.join(f'{column:>13}' for column in columns))
+    print(f'{"":>13}{"":>13}{"":>13}{"":>13}' + f'{"(us/tick)":>13}' * 5)
+    for target in args.counts:
+        result = measure(target, args)
+        print(''.join(f'{result[column]:>13,}' if isinstance(result[column], int)
+            else f'{result[column]:>13,.1f}' for column in columns))
@@ -0,0 +1,23 @@
+"""
+Alien Invasion
+John Mead
+This module sets up the test suite to run the game headless from the project folder.
+10-18-26
+"""
+
+import os
+import sys
+from pathlib import Path
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+os.environ['SDL_VIDEODRIVER'] = 'dummy'
+os.environ['SDL_AUDIODRIVER'] = 'dummy'
+
+
+@pytest.fixture(autouse=True)
+def project_folder(monkeypatch):
+    """Runs every test from the project folder, since Settings finds the assets from there.
+    """
+    monkeypatch.chdir(ROOT)
@@ -0,0 +1,104 @@
+"""
+Alien Invasion
+John Mead
+This module tests that the fleet's collision checks match pygame's and each other.
+10-18-26
+"""
+
+import pygame
+import pytest
+from settings import Settings
+from input_source import RandomInput
+from alien_invasion import AlienInvasion
+
+SEEDS = (1, 2, 3, 4, 5)
+TICKS = 6000
+
+
+def make_game(backend, seed, pixel_collisions=True, alien_size=(40, 40)):
+    """Creates a headless game driven by seeded random input that fires often.
+
+    Args:
+        backend (str): 'sprite' or 'numpy'.
+        seed (int): Seed for the input.
+        pixel_collisions (bool, optional): Checks masks after rectangles. Defaults to True.
+        alien_size (tuple, optional): The (width, height) of an alien. Defaults to (40, 40).
+
+    Returns:
+        AlienInvasion: The game, not started yet.
+    """
+    settings = Settings()
+    settings.fleet_backend = backend
+    settings.pixel_collisions = pixel_collisions
+    settings.alien_w, settings.alien_h = alien_size
+    return AlienInvasion(settings, headless=True, input_source=RandomInput(seed, 0.5))
+
+
+def play(game, seed):
+    """Plays one game and describes how it went.
+
+    Args:
+        game (AlienInvasion): The game to play.
+        seed (int): Seed for the game's random numbers.
+
+    Returns:
+        tuple: The ticks played, score, level, ships lost, and the aliens left.
+    """
+    ticks = game.run_headless(TICKS, seed)
+    fleet = game.alien_fleet
+    aliens = sorted(alien.index for alien in fleet.fleet)
+    return ticks, game.game_stats.score, game.game_stats.level, game.game_stats.ships_lost, aliens
+
+
+def first_hits(fleet_group, bullets):
+    """Works out the collisions pygame.sprite.groupcollide(fleet, bullets, True, True) would
+    find, without killing anything. Each bullet goes to the first alien it overlaps.
+
+    Args:
+        fleet_group (pygame.sprite.Group): The aliens, in fleet order.
+        bullets (pygame.sprite.Group): The bullets.
+
+    Returns:
+        dict: Alien index to the sorted ids of the bullets that hit it.
+    """
+    used = set()
+    hits = {}
+    for alien, overlapping in pygame.sprite.groupcollide(fleet_group, bullets, False, False).items():
+        fresh = [id(bullet) for bullet in overlapping if id(bullet) not in used]
+        if fresh:
+            used.update(fresh)
+            hits[alien.index] = sorted(fresh)
+    return hits
+
+
+@pytest.mark.parametrize('seed', SEEDS)
+def test_backends_play_the_same(seed):
+    assert play(make_game('sprite', seed), seed) == play(make_game('numpy', seed), seed)
+
+
+@pytest.mark.parametrize('alien_size', [(40, 40), (30, 50)])
+@pytest.mark.parametrize('seed', SEEDS)
+def test_grid_matches_groupcollide(seed, alien_size):
+    game = make_game('sprite', seed, pixel_collisions=False, alien_size=alien_size)
+    fleet = game.alien_fleet
+    assert fleet.aliens[0].rect.size == alien_size
+    check_collisions = fleet.check_collisions
+    compared = {'ticks': 0, 'hits': 0}
+
+    def checked(other_group):
+        expected = first_hits(fleet.fleet, other_group)
+        ship_hits = sorted(alien.index for alien in
+            pygame.sprite.spritecollide(game.ship, fleet.fleet, False))
+        assert sorted(alien.index for alien in fleet.collide_rect(game.ship.rect)) == ship_hits
+        assert fleet.grid.bottom() == max(alien.rect.bottom for alien in fleet.fleet)
+
+        collisions = check_collisions(other_group)
+        assert {alien.index: sorted(map(id, bullets)) for alien, bullets in collisions.items()} == expected
+        compared['ticks'] += 1
+        compared['hits'] += len(expected)
+        return collisions
+
+    fleet.check_collisions = checked
+    play(game, seed)
+    assert compared['ticks'] > 100
+    assert compared['hits'] > 0
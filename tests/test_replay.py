@@ -0,0 +1,55 @@
+"""
+Alien Invasion
+John Mead
+This module tests that recorded games are saved, loaded, and replayed exactly.
+10-18-26
+"""
+
+import itertools
+import pytest
+from settings import Settings
+from input_source import InputState, RandomInput
+from alien_invasion import AlienInvasion, replay_game
+from replay import InputRecorder, ReplayInput, pack_input, unpack_input
+
+
+def test_inputs_round_trip():
+    for state in itertools.product((False, True), repeat=3):
+        assert unpack_input(pack_input(InputState(*state))) == InputState(*state)
+
+
+def test_recording_round_trip(tmp_path):
+    recorder = InputRecorder(1234, 800, 600)
+    states = [InputState(up, down, fire) for up, down, fire in
+        itertools.product((False, True), repeat=3)] * 50
+    for state in states:
+        recorder.record(state)
+    path = tmp_path / 'game.airp'
+    recorder.save(path, 4200)
+
+    replay = ReplayInput(path)
+    assert (replay.seed, replay.screen_w, replay.screen_h) == (1234, 800, 600)
+    assert (replay.ticks, replay.final_score) == (len(states), 4200)
+    assert [replay.poll(None) for _ in states] == states
+    assert replay.poll(None) == InputState()
+
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / 'not_a_replay.airp'
+    path.write_bytes(b'\0' * 64)
+    with pytest.raises(ValueError):
+        ReplayInput(path)
+
+
+def test_recorded_game_replays_to_the_same_score(tmp_path):
+    settings = Settings()
+    settings.record_replays = True
+    settings.replay_dir = tmp_path
+    game = AlienInvasion(settings, headless=True, input_source=RandomInput(7, 0.5))
+    ticks = game.run_headless(36000, 99)
+    assert not game.game_active
+
+    [path] = tmp_path.glob('*.airp')
+    replay = ReplayInput(path)
+    assert (replay.seed, replay.ticks, replay.final_score) == (99, ticks, game.game_stats.score)
+    assert replay_game(path)
@@ -0,0 +1,48 @@
+"""
+Alien Invasion
+John Mead
+This module handles the text cache class and all it's functions.
+10-18-26
+"""
+
+from collections import OrderedDict
+
+
+class TextCache:
+    """Remembers rendered text surfaces so the same string is never rendered twice in a row.
+
+    The least recently used strings are dropped once the cache is full.
+    """
+    def __init__(self, font, color, capacity=64) -> None:
+        """Initializes an empty cache for one font and color.
+
+        Args:
+            font (pygame.font.Font): The font to render with.
+            color (tuple): The text color.
+            capacity (int, optional): The most surfaces to keep. Defaults to 64.
+        """
+        self.font = font
+        self.color = color
+        self.capacity = capacity
+        self._surfaces = OrderedDict()
+
+
+    def render(self, text):
+        """Returns the surface for a string, rendering it only if it is not cached.
+
+        Args:
+            text (str): The text to render.
+
+        Returns:
+            pygame.Surface: The rendered text. It is shared, so it must not be drawn on.
+        """
+        surface = self._surfaces.get(text)
+        if surface is not None:
+            self._surfaces.move_to_end(text)
+            return surface
+
+        surface = self.font.render(text, True, self.color, None)
+        self._surfaces[text] = surface
+        if len(self._surfaces) > self.capacity:
+            self._surfaces.popitem(last=False)
+        return surface
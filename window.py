@@ -0,0 +1,210 @@
+"""
+Alien Invasion
+John Mead
+This module handles the window class and all it's functions.
+10-18-26
+"""
+
+import weakref
+import pygame
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from alien_invasion import AlienInvasion
+
+class Window:
+    """Shows the game in a window of any size.
+
+    The game plays in frame pixels at the size in Settings however big the
+    window is. When the frame fits the window at its own size, everything is
+    drawn onto the frame and copied to the window. Otherwise everything is
+    drawn straight into the window at its own resolution, keeping the frame's
+    shape. The background and every image are scaled once for the window's
+    size and reused until the next resize, and only positions are scaled as
+    they are drawn, so nothing is rescaled per frame.
+    """
+    def __init__(self, game: 'AlienInvasion', resizable=True) -> None:
+        """Opens the window at the frame's size and creates the frame.
+
+        Args:
+            game (AlienInvasion): The main game object.
+            resizable (bool, optional): Lets the player resize the window. Defaults to True.
+        """
+        self.game = game
+        self.settings = game.settings
+        size = (self.settings.screen_w, self.settings.screen_h)
+        self.surface = pygame.display.set_mode(size, pygame.RESIZABLE if resizable else 0)
+        self.frame = pygame.Surface(size).convert()
+        self.background = None
+        self._full_background = None
+        self._scaled = weakref.WeakKeyDictionary()
+        self.resize(size)
+
+
+    def resize(self, size):
+        """Works out where the game goes in a window of the new size and drops the images
+        scaled for the old size.
+
+        Args:
+            size (tuple): The window's new (width, height).
+        """
+        self.surface = pygame.display.get_surface()
+        frame_w, frame_h = self.frame.get_size()
+        scale = min(size[0] / frame_w, size[1] / frame_h)
+        output_size = (max(1, round(frame_w * scale)), max(1, round(frame_h * scale)))
+        self.output_rect = pygame.Rect((0, 0), output_size)
+        self.output_rect.center = (size[0] // 2, size[1] // 2)
+        self.scale = output_size[0] / frame_w
+
+        if output_size == self.frame.get_size():
+            self.canvas = self.frame
+        else:
+            self.canvas = self.surface.subsurface(self.output_rect)
+        self._scaled.clear()
+        if self.background is None or self.background.get_size() != output_size:
+            self.background = self._load_background(output_size)
+        self.surface.fill((0, 0, 0))
+        self.full_present = True
+
+
+    def _load_background(self, size):
+        """Makes the background at a size. At the frame's size it comes from the asset
+        cache like every other image. Any other size is scaled from the full size image,
+        which is decoded the first time the window is resized and kept in memory, so
+        dragging the window's edge never reads the file again or saves pixels to disk.
+
+        Args:
+            size (tuple): The (width, height) of the background.
+
+        Returns:
+            pygame.Surface: The background, converted to the display format.
+        """
+        if size == self.frame.get_size():
+            return self.game.assets.get_image(self.settings.bg_file, size, alpha=False)
+        if self._full_background is None:
+            self._full_background = pygame.image.load(self.settings.bg_file).convert()
+        return pygame.transform.scale(self._full_background, size)
+
+
+    def scaled(self, image):
+        """Returns an image scaled for the window, scaling it the first time it is asked for.
+
+        Args:
+            image (pygame.Surface): The image at frame size.
+
+        Returns:
+            pygame.Surface: The image at window size. It is shared, so it must not be drawn on.
+        """
+        scaled = self._scaled.get(image)
+        if scaled is None:
+            w, h = image.get_size()
+            size = (max(1, round(w * self.scale)), max(1, round(h * self.scale)))
+            if self.settings.smooth_scaling and image.get_bitsize() >= 24:
+                scaled = pygame.transform.smoothscale(image, size)
+            else:
+                scaled = pygame.transform.scale(image, size)
+            self._scaled[image] = scaled
+        return scaled
+
+
+    def to_canvas(self, rect):
+        """Converts a position or area in the frame to the matching one on the canvas.
+
+        Args:
+            rect (tuple): The (x, y) position or (x, y, w, h) area in the frame.
+
+        Returns:
+            tuple: The position, or a pygame.Rect for an area, on the canvas.
+        """
+        scale = self.scale
+        if len(rect) == 2:
+            return (round(rect[0] * scale), round(rect[1] * scale))
+        return pygame.Rect(round(rect[0] * scale), round(rect[1] * scale),
+            round(rect[2] * scale), round(rect[3] * scale))
+
+
+    def blit(self, image, pos):
+        """Draws an image at a position in the frame.
+
+        Args:
+            image (pygame.Surface): The image at frame size.
+            pos (tuple): The (x, y) top left position, or a rect, in the frame.
+
+        Returns:
+            pygame.Rect: The area drawn on the canvas.
+        """
+        if self.canvas is self.frame:
+            return self.frame.blit(image, pos)
+        return self.canvas.blit(self.scaled(image), self.to_canvas(pos[:2]))
+
+
+    def blits(self, pairs):
+        """Draws many images in one batch.
+
+        Args:
+            pairs (list): (image, position) pairs in the frame.
+
+        Returns:
+            list[pygame.Rect]: The areas drawn on the canvas.
+        """
+        if self.canvas is self.frame:
+            return self.frame.blits(pairs)
+        scaled = self.scaled
+        scale = self.scale
+        return self.canvas.blits([(scaled(image), (round(pos[0] * scale), round(pos[1] * scale)))
+            for image, pos in pairs])
+
+
+    def fill(self, color, rect):
+        """Fills an area of the frame with a solid color.
+
+        Args:
+            color (tuple): The color to fill with.
+            rect (pygame.Rect): The area in the frame.
+
+        Returns:
+            pygame.Rect: The area filled on the canvas.
+        """
+        if self.canvas is self.frame:
+            return self.frame.fill(color, rect)
+        return self.canvas.fill(color, self.to_canvas(rect))
+
+
+    def present(self, rects=None):
+        """Shows what was drawn and updates the display.
+
+        Args:
+            rects (list[pygame.Rect], optional): The only areas of the canvas that changed.
+                Defaults to None, which presents all of it.
+        """
+        if self.canvas is not self.frame:
+            if rects is None or self.full_present:
+                rects = None
+            else:
+                rects = [rect.move(self.output_rect.topleft) for rect in rects]
+        elif rects is None or self.full_present:
+            self.surface.blit(self.frame, self.output_rect)
+            rects = None
+        else:
+            rects = [self.surface.blit(self.frame, rect.move(self.output_rect.topleft), rect)
+                for rect in rects]
+
+        if rects is None:
+            pygame.display.flip()
+            self.full_present = False
+        else:
+            pygame.display.update(rects)
+
+
+    def to_frame(self, pos):
+        """Converts a position in the window to the matching position in the frame.
+
+        Args:
+            pos (tuple): The (x, y) position in the window, such as the mouse.
+
+        Returns:
+            tuple: The (x, y) position in the frame.
+        """
+        frame_w, frame_h = self.frame.get_size()
+        return ((pos[0] - self.output_rect.x) * frame_w // self.output_rect.w,
+            (pos[1] - self.output_rect.y) * frame_h // self.output_rect.h)